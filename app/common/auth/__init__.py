@@ -33,7 +33,7 @@ def request_a_link_to_sign_in() -> ResponseReturnValue:
         email = cast(str, form.email_address.data)
 
         internal_domains = current_app.config["INTERNAL_DOMAINS"]
-        if email.endswith(internal_domains):
+        if email.lower().endswith(internal_domains):
             session["magic_link_redirect"] = True
             return redirect(url_for("auth.sso_sign_in"))
 
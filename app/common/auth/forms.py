@@ -3,13 +3,15 @@ from govuk_frontend_wtf.wtforms_widgets import GovSubmitInput, GovTextInput
 from wtforms import StringField, SubmitField
 from wtforms.validators import DataRequired, Email
 
+from app.common.forms.validators import INVALID_EMAIL_FORMAT_MESSAGE
+
 
 class SignInForm(FlaskForm):
     email_address = StringField(
         "Email address",
         validators=[
             DataRequired(message="Enter your email address"),
-            Email(message="Enter an email address in the correct format, like name@example.com"),
+            Email(message=INVALID_EMAIL_FORMAT_MESSAGE),
         ],
         filters=[lambda x: x.strip() if x else x],
         widget=GovTextInput(),
@@ -28,7 +28,12 @@ from app.common.forms.fields import (
     MHCLGCheckboxesInput,
     MHCLGRadioInput,
 )
-from app.common.forms.validators import FinalOptionExclusive, URLWithoutProtocol, WordRange
+from app.common.forms.validators import (
+    INVALID_EMAIL_FORMAT_MESSAGE,
+    FinalOptionExclusive,
+    URLWithoutProtocol,
+    WordRange,
+)
 
 _accepted_fields = (
     EmailField
@@ -154,7 +159,7 @@ def build_question_form(  # noqa: C901
                     widget=GovTextInput(),
                     validators=[
                         DataRequired(f"Enter the {question.name}"),
-                        Email(message="Enter an email address in the correct format, like name@example.com"),
+                        Email(message=INVALID_EMAIL_FORMAT_MESSAGE),
                     ],
                     filters=[lambda x: x.strip() if x else x],
                 )
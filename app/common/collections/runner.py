@@ -110,7 +110,9 @@ class FormRunner:
             ).all_answered
             self._check_your_answers_form = CheckYourAnswersForm(
                 section_completed=(
-                    "yes" if self.submission.get_status_for_form(self.form) == SubmissionStatusEnum.COMPLETED else None
+                    "yes"
+                    if self.submission.cached_get_status_for_form(self.form) == SubmissionStatusEnum.COMPLETED
+                    else None
                 ),
                 all_questions_answered=all_questions_answered,
             )
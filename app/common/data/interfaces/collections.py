@@ -68,9 +68,12 @@ def get_collection(
     grant_id: UUID | None = None,
     type_: CollectionType | None = None,
     with_full_schema: bool = False,
+    with_grant: bool = False,
 ) -> Collection:
     """Get a collection by ID."""
     options = []
+    if with_grant:
+        options.append(joinedload(Collection.grant))
     if with_full_schema:
         options.extend(
             [
@@ -92,6 +95,12 @@ def get_collection(
     return db.session.scalars(select(Collection).where(*filters).options(*options)).unique().one()
 
 
+def get_collection_ids(grant_id: UUID, type_: CollectionType, limit: int | None = None) -> Sequence[UUID]:
+    """Get the IDs of a grant's collections of a given type, without loading the collections themselves."""
+    statement = select(Collection.id).where(Collection.grant_id == grant_id, Collection.type == type_).limit(limit)
+    return db.session.scalars(statement).all()
+
+
 @flush_and_rollback_on_exceptions(coerce_exceptions=[(IntegrityError, DuplicateValueError)])
 def update_collection(  # noqa: C901
     collection: Collection,
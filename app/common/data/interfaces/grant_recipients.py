@@ -1,7 +1,8 @@
 import uuid
-from typing import Sequence
+from typing import Iterable, NamedTuple, Sequence
 
-from sqlalchemy import and_, delete, func, select
+from sqlalchemy import Select, and_, delete, func, insert, select, tuple_
+from sqlalchemy.orm import contains_eager, selectinload
 
 from app.common.data.interfaces.exceptions import flush_and_rollback_on_exceptions
 from app.common.data.models import Grant, GrantRecipient, Organisation
@@ -10,53 +11,76 @@ from app.common.data.types import RoleEnum
 from app.extensions import db
 
 
-def get_grant_recipients(grant: "Grant") -> Sequence["GrantRecipient"]:
-    return db.session.scalars(select(GrantRecipient).where(GrantRecipient.grant_id == grant.id)).all()
+def get_grant_recipients(grant: "Grant", with_organisations: bool = False) -> Sequence["GrantRecipient"]:
+    options = []
+    if with_organisations:
+        options.append(selectinload(GrantRecipient.organisation))
+
+    return db.session.scalars(select(GrantRecipient).where(GrantRecipient.grant_id == grant.id).options(*options)).all()
+
+
+class ReportingLifecycleCounts(NamedTuple):
+    organisations: int
+    grant_recipients: int
+    grant_recipient_users: int
+
+
+def _get_grant_recipients_count_statement(grant: "Grant") -> Select[tuple[int]]:
+    return select(func.count()).select_from(GrantRecipient).where(GrantRecipient.grant_id == grant.id)
+
+
+def get_grant_recipient_organisation_ids_by_name(grant: "Grant", names: Iterable[str]) -> dict[str, uuid.UUID]:
+    """Get the organisation IDs of any of the named organisations that are grant recipients for a grant."""
+    statement = (
+        select(Organisation.name, Organisation.id)
+        .join(GrantRecipient, GrantRecipient.organisation_id == Organisation.id)
+        .where(GrantRecipient.grant_id == grant.id, Organisation.name.in_(set(names)))
+    )
+    return {name: organisation_id for name, organisation_id in db.session.execute(statement)}
 
 
 def get_grant_recipients_count(grant: "Grant") -> int:
-    statement = select(func.count()).select_from(GrantRecipient).where(GrantRecipient.grant_id == grant.id)
-    return db.session.scalar(statement) or 0
+    return db.session.scalar(_get_grant_recipients_count_statement(grant)) or 0
 
 
 @flush_and_rollback_on_exceptions()
 def create_grant_recipients(grant: "Grant", organisation_ids: list[uuid.UUID]) -> None:
-    grant_recipients = []
-
-    for organisation_id in organisation_ids:
-        grant_recipients.append(GrantRecipient(grant_id=grant.id, organisation_id=organisation_id))
+    if not organisation_ids:
+        return
 
-    db.session.add_all(grant_recipients)
+    # A single multi-row INSERT rather than one INSERT per grant recipient when the session is flushed.
+    db.session.execute(
+        insert(GrantRecipient).values(
+            [{"grant_id": grant.id, "organisation_id": organisation_id} for organisation_id in organisation_ids]
+        )
+    )
 
 
 def all_grant_recipients_have_users(grant: "Grant") -> bool:
-    grant_recipients = get_grant_recipients(grant)
-
-    if not grant_recipients:
-        return False
-
-    for grant_recipient in grant_recipients:
-        user_count = db.session.scalar(
-            select(func.count())
-            .select_from(UserRole)
-            .join(UserRole.organisation)
-            .where(
-                UserRole.grant_id == grant.id,
-                UserRole.organisation_id == grant_recipient.organisation_id,
-                Organisation.can_manage_grants.is_(False),
-                UserRole.permissions.contains(
-                    [RoleEnum.MEMBER]
-                ),  # TODO: might become a 'DATA_PROVIDER' permission with Access work
-            )
+    grant_recipients = select(GrantRecipient.id).where(GrantRecipient.grant_id == grant.id)
+    grant_recipient_has_users = (
+        select(UserRole.id)
+        .join(UserRole.organisation)
+        .where(
+            UserRole.grant_id == grant.id,
+            UserRole.organisation_id == GrantRecipient.organisation_id,
+            Organisation.can_manage_grants.is_(False),
+            UserRole.permissions.contains(
+                [RoleEnum.MEMBER]
+            ),  # TODO: might become a 'DATA_PROVIDER' permission with Access work
         )
-        if not user_count or user_count == 0:
-            return False
+        .exists()
+    )
 
-    return True
+    # Answer with existence checks in the database, rather than loading every grant recipient and counting its users.
+    has_grant_recipients, has_grant_recipient_without_users = db.session.execute(
+        select(grant_recipients.exists(), grant_recipients.where(~grant_recipient_has_users).exists())
+    ).one()
+    return bool(has_grant_recipients and not has_grant_recipient_without_users)
 
 
-def get_grant_recipient_users_count(grant: Grant) -> int:
-    statement = (
+def _get_grant_recipient_users_count_statement(grant: Grant) -> Select[tuple[int]]:
+    return (
         select(func.count())
         .select_from(UserRole)
         .join(UserRole.organisation)
@@ -68,11 +92,33 @@ def get_grant_recipient_users_count(grant: Grant) -> int:
             ),  # TODO: might become a 'DATA_PROVIDER' permission with Access work
         )
     )
-    return db.session.scalar(statement) or 0
+
+
+def get_grant_recipient_users_count(grant: Grant) -> int:
+    return db.session.scalar(_get_grant_recipient_users_count_statement(grant)) or 0
+
+
+def get_reporting_lifecycle_counts(grant: Grant) -> ReportingLifecycleCounts:
+    """Get the counts shown on a grant's reporting lifecycle tasklist, in a single round trip to the database."""
+    statement = select(
+        select(func.count())
+        .select_from(Organisation)
+        .where(Organisation.can_manage_grants.is_(False))
+        .scalar_subquery(),
+        _get_grant_recipients_count_statement(grant).scalar_subquery(),
+        _get_grant_recipient_users_count_statement(grant).scalar_subquery(),
+    )
+    organisations, grant_recipients, grant_recipient_users = db.session.execute(statement).one()
+    return ReportingLifecycleCounts(
+        organisations=organisations,
+        grant_recipients=grant_recipients,
+        grant_recipient_users=grant_recipient_users,
+    )
 
 
 def get_grant_recipient_users_by_organisation(grant: Grant) -> dict[GrantRecipient, Sequence[User]]:
-    grant_recipients = get_grant_recipients(grant)
+    # Callers show each grant recipient's organisation name alongside its users.
+    grant_recipients = get_grant_recipients(grant, with_organisations=True)
     result = {}
 
     for grant_recipient in grant_recipients:
@@ -102,28 +148,36 @@ def get_grant_recipient_user_roles(grant: Grant) -> Sequence[UserRole]:
     """
     statement = (
         select(UserRole)
-        .join(User, UserRole.user_id == User.id)
-        .join(Organisation, Organisation.id == UserRole.organisation_id)
+        .join(UserRole.user)
+        .join(UserRole.organisation)
         .where(
             UserRole.grant_id == grant.id,
             UserRole.permissions.contains(
                 [RoleEnum.MEMBER]
             ),  # TODO: might become a 'DATA_PROVIDER' permission with Access work
         )
+        # Populate the relationships from the joins we're already doing, as callers show the user and organisation for
+        # every role.
+        .options(contains_eager(UserRole.user), contains_eager(UserRole.organisation))
     )
 
     return db.session.scalars(statement).all()
 
 
 @flush_and_rollback_on_exceptions
-def revoke_grant_recipient_user_role(user_id: uuid.UUID, organisation_id: uuid.UUID, grant_id: uuid.UUID) -> bool:
+def revoke_grant_recipient_user_roles(
+    user_and_organisation_ids: Sequence[tuple[uuid.UUID, uuid.UUID]], grant_id: uuid.UUID
+) -> int:
+    """Revoke grant recipient member roles for each (user ID, organisation ID) pair, returning how many were revoked."""
+    if not user_and_organisation_ids:
+        return 0
+
     subquery = (
         select(UserRole.id)
         .join(UserRole.organisation)
         .where(
             and_(
-                UserRole.user_id == user_id,
-                UserRole.organisation_id == organisation_id,
+                tuple_(UserRole.user_id, UserRole.organisation_id).in_(user_and_organisation_ids),
                 Organisation.can_manage_grants.is_(False),
                 UserRole.grant_id == grant_id,
                 UserRole.permissions.contains(
@@ -133,12 +187,18 @@ def revoke_grant_recipient_user_role(user_id: uuid.UUID, organisation_id: uuid.U
         )
     )
 
-    statement = delete(UserRole).where(UserRole.id.in_(subquery))
-    result = db.session.execute(statement)
+    statement = delete(UserRole).where(UserRole.id.in_(subquery)).returning(UserRole.user_id)
+    revoked_user_ids = db.session.scalars(statement).all()
     db.session.flush()
 
-    user = db.session.get(User, user_id)
-    if user:
-        db.session.expire(user)
+    # Only users already loaded into the session can have stale roles, so there's no need to fetch any others.
+    for user_id in set(revoked_user_ids):
+        user = db.session.identity_map.get(db.session.identity_key(User, user_id))
+        if user:
+            db.session.expire(user)
 
-    return bool(result.rowcount > 0)  # type: ignore[attr-defined]
+    return len(revoked_user_ids)
+
+
+def revoke_grant_recipient_user_role(user_id: uuid.UUID, organisation_id: uuid.UUID, grant_id: uuid.UUID) -> bool:
+    return revoke_grant_recipient_user_roles([(user_id, organisation_id)], grant_id) > 0
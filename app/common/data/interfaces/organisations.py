@@ -25,8 +25,11 @@ def upsert_organisations(organisations: list[OrganisationData]) -> None:
     existing_active_orgs = db.session.scalars(
         select(Organisation.id).where(Organisation.status == OrganisationStatus.ACTIVE)
     ).all()
-    for org in organisations:
-        values = {
+
+    # Upsert every organisation in a single statement. Postgres won't let one upsert update the same row twice, so if
+    # an external ID appears more than once we keep the last one, as upserting each organisation in turn would.
+    values_by_external_id = {
+        org.external_id: {
             "external_id": org.external_id,
             "name": org.name,
             "type": org.type,
@@ -35,11 +38,16 @@ def upsert_organisations(organisations: list[OrganisationData]) -> None:
             "active_date": org.active_date,
             "retirement_date": org.retirement_date,
         }
+        for org in organisations
+    }
+    if values_by_external_id:
+        rows = list(values_by_external_id.values())
+        statement = postgresql_upsert(Organisation).values(rows)
         db.session.execute(
-            postgresql_upsert(Organisation)
-            .values(**values)
-            .on_conflict_do_update(index_elements=["external_id"], set_=values),
-            execution_options={"populate_existing": True},
+            statement.on_conflict_do_update(
+                index_elements=["external_id"],
+                set_={column: statement.excluded[column] for column in rows[0]},
+            )
         )
 
     db.session.flush()
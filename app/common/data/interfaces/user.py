@@ -72,6 +72,29 @@ def upsert_user_by_email(
     return user
 
 
+@flush_and_rollback_on_exceptions
+def upsert_users_by_email(users: Sequence[tuple[str, str]]) -> dict[str, User]:
+    """
+    Bulk version of `upsert_user_by_email`, creating or updating a user for each (email address, name) pair in a single
+    statement. Returns the users keyed by lowercased email address.
+    """
+    # Postgres won't let a single upsert update the same row twice, so collapse repeated email addresses (which are
+    # case-insensitive) first, keeping the last one given to match what upserting each pair in turn would do.
+    values_by_email = {email_address.lower(): {"email": email_address, "name": name} for email_address, name in users}
+    if not values_by_email:
+        return {}
+
+    statement = postgresql_upsert(User).values(list(values_by_email.values()))
+    upserted_users = db.session.scalars(
+        statement.on_conflict_do_update(
+            index_elements=["email"], set_={"email": statement.excluded.email, "name": statement.excluded.name}
+        ).returning(User),
+        execution_options={"populate_existing": True},
+    ).all()
+
+    return {user.email.lower(): user for user in upserted_users}
+
+
 @flush_and_rollback_on_exceptions
 def upsert_user_by_azure_ad_subject_id(
     azure_ad_subject_id: str,
@@ -135,6 +158,45 @@ def upsert_user_role(
     return user_role
 
 
+@flush_and_rollback_on_exceptions(coerce_exceptions=[(IntegrityError, InvalidUserRoleError)])
+def upsert_user_roles(
+    users_and_organisation_ids: Sequence[tuple[User, uuid.UUID]],
+    permissions: list[RoleEnum],
+    grant_id: uuid.UUID | None = None,
+) -> None:
+    """
+    Bulk version of `upsert_user_role`, giving each user the same permissions in their paired organisation (and
+    optionally grant) in a single statement.
+    """
+    # As with `upsert_users_by_email`, each row can only be touched once by a single upsert.
+    user_ids_and_organisation_ids = dict.fromkeys(
+        (user.id, organisation_id) for user, organisation_id in users_and_organisation_ids
+    )
+    if not user_ids_and_organisation_ids:
+        return
+
+    statement = postgresql_upsert(UserRole).values(
+        [
+            {
+                "user_id": user_id,
+                "organisation_id": organisation_id,
+                "grant_id": grant_id,
+                "permissions": permissions,
+            }
+            for user_id, organisation_id in user_ids_and_organisation_ids
+        ]
+    )
+    db.session.execute(
+        statement.on_conflict_do_update(
+            index_elements=["user_id", "organisation_id", "grant_id"],
+            set_={"permissions": statement.excluded.permissions},
+        )
+    )
+    db.session.flush()
+    for user, _ in users_and_organisation_ids:
+        db.session.expire(user)
+
+
 @flush_and_rollback_on_exceptions
 def set_platform_admin_role_for_user(user: User) -> UserRole:
     # Before making someone a platform admin we should remove any other roles they might have assigned to them, as a
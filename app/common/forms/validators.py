@@ -1,7 +1,7 @@
 import re
-from typing import List, Tuple, cast
+import sys
+from typing import cast
 
-from email_validator import EmailNotValidError, validate_email
 from flask import current_app
 from wtforms import StringField
 from wtforms.fields.choices import SelectMultipleField
@@ -9,6 +9,8 @@ from wtforms.fields.core import Field
 from wtforms.form import BaseForm
 from wtforms.validators import Email, HostnameValidation, Regexp, ValidationError
 
+INVALID_EMAIL_FORMAT_MESSAGE = "Enter an email address in the correct format, like name@example.com"
+
 
 class WordRange:
     """
@@ -29,38 +31,56 @@ class WordRange:
         self.max_words = max_words
         self.field_display_name = field_display_name
 
-    def __call__(self, form: BaseForm, field: Field) -> None:
-        if not field.data:
-            return  # Don't validate empty fields - use DataRequired for that
-
-        words = field.data.split()
-        word_count = len(words)
-        field_display_name = self.field_display_name or field.name
-
         # Ensure first character is uppercase since we start all validation messages with it.
-        field_display_name = field_display_name[0].upper() + field_display_name[1:]
+        self._capitalised_display_name = (
+            field_display_name[0].upper() + field_display_name[1:] if field_display_name else None
+        )
 
-        if self.min_words is not None and self.max_words is not None:
-            if self.min_words == self.max_words and word_count != self.min_words:
-                raise ValidationError(f"{field_display_name} must contain exactly {self.min_words} words")
+        # Resolve the bounds up front so that checking an answer that's within range is a single comparison.
+        self._lower_bound = min_words if min_words is not None else 0
+        self._upper_bound = max_words if max_words is not None else sys.maxsize
 
-            if word_count < self.min_words or word_count > self.max_words:
-                raise ValidationError(
-                    f"{field_display_name} must be between {self.min_words} words and {self.max_words} words"
+        # We only need to know how the count compares to the bounds, so we can stop splitting once we've gone past
+        # them rather than materialising every word of a potentially very long answer.
+        self._split_limit = max_words if max_words is not None else self._lower_bound
+
+        if min_words is not None and max_words is not None:
+            if min_words == max_words:
+                self._message_template = f"{{field_display_name}} must contain exactly {min_words} words"
+            else:
+                self._message_template = (
+                    f"{{field_display_name}} must be between {min_words} words and {max_words} words"
                 )
+        elif min_words is not None:
+            self._message_template = f"{{field_display_name}} must be {min_words} words or more"
+        else:
+            self._message_template = f"{{field_display_name}} must be {max_words} words or fewer"
+
+    def __call__(self, form: BaseForm, field: Field) -> None:
+        if not field.data:
+            return  # Don't validate empty fields - use DataRequired for that
 
-        if self.min_words is not None:
-            if word_count < self.min_words:
-                raise ValidationError(f"{field_display_name} must be {self.min_words} words or more")
+        word_count = len(field.data.split(maxsplit=self._split_limit))
+        if self._lower_bound <= word_count <= self._upper_bound:
+            return
 
-        if self.max_words is not None:
-            if word_count > self.max_words:
-                raise ValidationError(f"{field_display_name} must be {self.max_words} words or fewer")
+        field_display_name = self._capitalised_display_name or field.name[0].upper() + field.name[1:]
+        raise ValidationError(self._message_template.format(field_display_name=field_display_name))
 
 
 class CommunitiesEmail(Email):
     def __call__(self, form: BaseForm, field: Field) -> None:
         allowed_domains = current_app.config["INTERNAL_DOMAINS"]
+
+        # Cheap pre-check so that obviously malformed input doesn't go through the full parse and normalisation in
+        # `validate_email`, which would reject it anyway.
+        if "@" not in (field.data or ""):
+            raise ValidationError(INVALID_EMAIL_FORMAT_MESSAGE)
+
+        # Imported here rather than at module level (as WTForms' own `Email` validator does) because it takes a
+        # noticeable amount of time to import and only a few of our forms ever validate email addresses.
+        from email_validator import EmailNotValidError, validate_email
+
         try:
             result = validate_email(
                 field.data,
@@ -68,11 +88,13 @@ class CommunitiesEmail(Email):
                 allow_smtputf8=self.allow_smtputf8,
                 allow_empty_local=self.allow_empty_local,
             )
+            # `email_validator` has already normalised the domain to lowercase, and INTERNAL_DOMAINS is lowercased when
+            # the config is loaded, so we can compare them directly.
             domain = f"@{result.domain}"
         except EmailNotValidError as e:
-            raise ValidationError("Enter an email address in the correct format, like name@example.com") from e
+            raise ValidationError(INVALID_EMAIL_FORMAT_MESSAGE) from e
 
-        if allowed_domains and domain.lower() not in [d.lower() for d in allowed_domains]:
+        if allowed_domains and domain not in allowed_domains:
             raise ValidationError(f"Email address must end with {' or '.join(allowed_domains)}")
 
 
@@ -81,15 +103,25 @@ class URLWithoutProtocol(Regexp):
     Based off the `URL` validator from WTForms, except we specifically allow no protocol (eg https://) to be provided.
     """
 
+    # Compiled once and shared by every instance, as we build a new validator each time a question form is created.
+    _PATTERN = re.compile(
+        r"^(?P<protocol>https?://)?"
+        r"(?P<host>[^\/\?:]+)"
+        r"(?P<port>:[0-9]+)?"
+        r"(?P<path>\/.*?)?"
+        r"(?P<query>\?.*)?$",
+        re.IGNORECASE,
+    )
+
+    # Plain ASCII hostnames with a TLD, which is almost every URL we see. Anything this accepts would also be accepted
+    # by `HostnameValidation`, so we can skip its IP address checks and IDNA encoding for them.
+    _ASCII_HOSTNAME_PATTERN = re.compile(
+        r"^(?=.{1,253}\Z)(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,20}\Z",
+        re.IGNORECASE,
+    )
+
     def __init__(self, require_tld: bool = True, allow_ip: bool = True, message: str | None = None) -> None:
-        regex = (
-            r"^(?P<protocol>https?://)?"
-            r"(?P<host>[^\/\?:]+)"
-            r"(?P<port>:[0-9]+)?"
-            r"(?P<path>\/.*?)?"
-            r"(?P<query>\?.*)?$"
-        )
-        super().__init__(regex, re.IGNORECASE, message)
+        super().__init__(self._PATTERN, message=message)
         self.validate_hostname = HostnameValidation(require_tld=require_tld, allow_ip=allow_ip)
 
     def __call__(self, form: BaseForm, field: StringField, message: str | None = None) -> re.Match[str]:
@@ -98,7 +130,8 @@ class URLWithoutProtocol(Regexp):
             message = field.gettext("Invalid URL.")
 
         match = super().__call__(form, field, message)
-        if not self.validate_hostname(match.group("host")):
+        host = match.group("host")
+        if not self._ASCII_HOSTNAME_PATTERN.match(host) and not self.validate_hostname(host):
             raise ValidationError(message)
 
         return match
@@ -125,9 +158,12 @@ class FinalOptionExclusive:
             return  # Don't validate empty fields - use DataRequired for that
 
         checkbox_choices = field.data
+        if len(checkbox_choices) < 2:
+            return  # A single selection can't combine the final option with any others
+
         # MyPy expects field.choices to be a dict[str, Any] but in our implementation with wtforms it's a list of tuples
-        form_choices = cast(List[Tuple[str, str]], field.choices)
-        final_option_key, final_option_label, *_ = form_choices[-1]
-        if final_option_key in checkbox_choices and len(checkbox_choices) > 1:
-            message = self.message or f"Select {self.question_name}, or select {final_option_label}"
+        form_choices = cast("list[tuple[str, str]]", field.choices)
+        final_option = form_choices[-1]
+        if final_option[0] in checkbox_choices:
+            message = self.message or f"Select {self.question_name}, or select {final_option[1]}"
             raise ValidationError(message)
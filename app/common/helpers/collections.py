@@ -1,10 +1,11 @@
 import csv
 import json
 import uuid
+from collections import defaultdict
 from datetime import datetime
 from functools import cached_property, lru_cache, partial
 from io import StringIO
-from itertools import chain
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any, Callable, List, NamedTuple, Optional, Union, cast
 from uuid import UUID
 
@@ -94,12 +95,22 @@ class SubmissionHelper:
         self.cached_get_all_questions_are_answered_for_form = lru_cache(maxsize=None)(
             self._get_all_questions_are_answered_for_form
         )
-        self.cached_evaluation_context = ExpressionContext.build_expression_context(
+        self.cached_get_status_for_form = lru_cache(maxsize=None)(self._get_status_for_form)
+        self.cached_get_all_conditions_for_component = lru_cache(maxsize=None)(self._get_all_conditions_for_component)
+
+    # The expression contexts deserialise every answer in the submission, so only build them once something needs
+    # them - eg listing or exporting submissions only ever evaluates conditions and never interpolates.
+    @cached_property
+    def cached_evaluation_context(self) -> ExpressionContext:
+        return ExpressionContext.build_expression_context(
             collection=self.submission.collection,
             submission_helper=self,
             mode="evaluation",
         )
-        self.cached_interpolation_context = ExpressionContext.build_expression_context(
+
+    @cached_property
+    def cached_interpolation_context(self) -> ExpressionContext:
+        return ExpressionContext.build_expression_context(
             collection=self.submission.collection,
             submission_helper=self,
             mode="interpolation",
@@ -140,23 +151,30 @@ class SubmissionHelper:
     ) -> dict[str, Any]:
         form_data: dict[str, Any] = {}
 
-        for form in self.collection.forms:
-            for question in form.cached_questions:
-                # we'll only add add another answers if a context is provided which will be hooked in
-                # with the form runner
-                if not question.add_another_container:
-                    answer = self.cached_get_answer_for_question(question.id)
-                    if answer is not None:
-                        form_data[question.safe_qid] = answer.get_value_for_form()
-                else:
-                    if add_another_container and add_another_index is not None:
-                        count = self.get_count_for_add_another(add_another_container)
-                        if question.add_another_container == add_another_container and add_another_index < count:
-                            answer = self.cached_get_answer_for_question(
-                                question.id, add_another_index=add_another_index
-                            )
-                            if answer is not None:
-                                form_data[question.safe_qid] = answer.get_value_for_form()
+        # Walk the answers we actually have rather than every question in the collection, resolving each one to its
+        # question through the index so that building the form data stays linear in the size of the submission.
+        for question_id, serialised_data in self.submission.data.items():
+            question = self._questions_by_id.get(UUID(question_id))
+            if question is None or question.add_another_container or serialised_data is None:
+                continue
+            form_data[question.safe_qid] = _deserialise_question_type(question, serialised_data).get_value_for_form()
+
+        # we'll only add add another answers if a context is provided which will be hooked in
+        # with the form runner
+        if add_another_container and add_another_index is not None:
+            entries = self.submission.data.get(str(add_another_container.id)) or []
+            if add_another_index < len(entries):
+                for question_id, serialised_data in entries[add_another_index].items():
+                    question = self._questions_by_id.get(UUID(question_id))
+                    if (
+                        question is None
+                        or question.add_another_container != add_another_container
+                        or serialised_data is None
+                    ):
+                        continue
+                    form_data[question.safe_qid] = _deserialise_question_type(
+                        question, serialised_data
+                    ).get_value_for_form()
 
         return form_data
 
@@ -165,7 +183,7 @@ class SubmissionHelper:
             return len(answers)
         return 0
 
-    @property
+    @cached_property
     def all_visible_questions(self) -> dict[UUID, "Question"]:
         return {
             question.id: question
@@ -173,11 +191,32 @@ class SubmissionHelper:
             for question in self.cached_get_ordered_visible_questions(form)
         }
 
+    @cached_property
+    def _event_keys_by_form_id(self) -> dict[UUID | None, set[SubmissionEventKey]]:
+        """
+        The keys of all events on the submission, grouped by the ID of the form they relate to (or `None` for
+        submission-level events). Needs resetting with `_clear_event_caches` whenever the submission's events change.
+        """
+        event_keys: dict[UUID | None, set[SubmissionEventKey]] = defaultdict(set)
+        for event in self.submission.events:
+            event_keys[event.form.id if event.form else None].add(event.key)
+        return event_keys
+
+    def _clear_event_caches(self) -> None:
+        self.__dict__.pop("_event_keys_by_form_id", None)
+        self.__dict__.pop("submitted_at_utc", None)
+        self.cached_get_status_for_form.cache_clear()
+
     @property
     def status(self) -> str:
-        submitted = SubmissionEventKey.SUBMISSION_SUBMITTED in [x.key for x in self.submission.events]
+        form_statuses = set()
+        for form in self.collection.forms:
+            form_statuses.add(self.cached_get_status_for_form(form))
+            if len(form_statuses) > 1:
+                # forms in different states can only mean the submission is in progress
+                return SubmissionStatusEnum.IN_PROGRESS
 
-        form_statuses = set([self.get_status_for_form(form) for form in self.collection.forms])
+        submitted = SubmissionEventKey.SUBMISSION_SUBMITTED in self._event_keys_by_form_id[None]
         if {SubmissionStatusEnum.COMPLETED} == form_statuses and submitted:
             return SubmissionStatusEnum.COMPLETED
         elif {SubmissionStatusEnum.NOT_STARTED} == form_statuses:
@@ -185,7 +224,7 @@ class SubmissionHelper:
         else:
             return SubmissionStatusEnum.IN_PROGRESS
 
-    @property
+    @cached_property
     def submitted_at_utc(self) -> datetime | None:
         if not self.is_completed:
             return None
@@ -227,21 +266,28 @@ class SubmissionHelper:
     def collection_id(self) -> UUID:
         return self.collection.id
 
+    @cached_property
+    def _forms_by_id(self) -> dict[UUID, "Form"]:
+        return {form.id: form for form in self.collection.forms}
+
+    @cached_property
+    def _questions_by_id(self) -> dict[UUID, "Question"]:
+        return {question.id: question for form in self.collection.forms for question in form.cached_questions}
+
+    @cached_property
+    def _forms_by_question_id(self) -> dict[UUID, "Form"]:
+        return {question.id: form for form in self.collection.forms for question in form.cached_questions}
+
     def get_form(self, form_id: uuid.UUID) -> "Form":
         try:
-            return next(filter(lambda f: f.id == form_id, self.collection.forms))
-        except StopIteration as e:
+            return self._forms_by_id[form_id]
+        except KeyError as e:
             raise ValueError(f"Could not find a form with id={form_id} in collection={self.collection.id}") from e
 
     def get_question(self, question_id: uuid.UUID) -> "Question":
         try:
-            return next(
-                filter(
-                    lambda q: q.id == question_id,
-                    chain.from_iterable(form.cached_questions for form in self.collection.forms),
-                )
-            )
-        except StopIteration as e:
+            return self._questions_by_id[question_id]
+        except KeyError as e:
             raise ValueError(
                 f"Could not find a question with id={question_id} in collection={self.collection.id}"
             ) from e
@@ -249,12 +295,20 @@ class SubmissionHelper:
     def _get_all_questions_are_answered_for_form(self, form: "Form") -> FormQuestionsAnswered:
         question_answer_status = []
 
+        # Every question in an add another container shares the same context for a given entry, so build each one
+        # once rather than re-reading all of the entry's answers for every question in the container.
+        add_another_contexts: dict[tuple[UUID, int], "ExpressionContext"] = {}
         for question in form.cached_questions:
             if question.add_another_container:
                 for i in range(self.get_count_for_add_another(question.add_another_container)):
-                    context = self.cached_evaluation_context.with_add_another_context(
-                        question, submission_helper=self, add_another_index=i
-                    )
+                    context_key = (question.add_another_container.id, i)
+                    context = add_another_contexts.get(context_key)
+                    if context is None:
+                        context = self.cached_evaluation_context.with_add_another_context(
+                            question, submission_helper=self, add_another_index=i
+                        )
+                        add_another_contexts[context_key] = context
+
                     if self.is_component_visible(question, context):
                         question_answer_status.append(
                             self.cached_get_answer_for_question(question.id, add_another_index=i) is not None
@@ -269,20 +323,19 @@ class SubmissionHelper:
 
     @cached_property
     def all_forms_are_completed(self) -> bool:
-        form_statuses = set([self.get_status_for_form(form) for form in self.collection.forms])
-        return {SubmissionStatusEnum.COMPLETED} == form_statuses
+        return bool(self.collection.forms) and all(
+            self.cached_get_status_for_form(form) == SubmissionStatusEnum.COMPLETED for form in self.collection.forms
+        )
 
     def get_tasklist_status_for_form(self, form: "Form") -> TasklistSectionStatusEnum:
         if len(form.cached_questions) == 0:
             return TasklistSectionStatusEnum.NO_QUESTIONS
 
-        return TasklistSectionStatusEnum(self.get_status_for_form(form))
+        return TasklistSectionStatusEnum(self.cached_get_status_for_form(form))
 
-    def get_status_for_form(self, form: "Form") -> str:
+    def _get_status_for_form(self, form: "Form") -> str:
         form_questions_answered = self.cached_get_all_questions_are_answered_for_form(form)
-        marked_as_complete = SubmissionEventKey.FORM_RUNNER_FORM_COMPLETED in [
-            x.key for x in self.submission.events if x.form and x.form.id == form.id
-        ]
+        marked_as_complete = SubmissionEventKey.FORM_RUNNER_FORM_COMPLETED in self._event_keys_by_form_id[form.id]
         if form.cached_questions and form_questions_answered.all_answered and marked_as_complete:
             return SubmissionStatusEnum.COMPLETED
         elif form_questions_answered.some_answered:
@@ -290,31 +343,28 @@ class SubmissionHelper:
         else:
             return SubmissionStatusEnum.NOT_STARTED
 
+    @cached_property
+    def _ordered_forms(self) -> list["Form"]:
+        # Forms don't currently have conditions of their own, so this doesn't depend on the submission's answers and
+        # can be sorted once for the lifetime of the helper.
+        return sorted(self.collection.forms, key=lambda f: f.order)
+
     def get_ordered_visible_forms(self) -> list["Form"]:
         """Returns the visible, ordered forms based upon the current state of this collection."""
-        return sorted(self.collection.forms, key=lambda f: f.order)
+        return self._ordered_forms
 
     def is_component_visible(
         self, component: "Component", context: "ExpressionContext", add_another_index: int | None = None
     ) -> bool:
-        # we can optimise this to exit early and do this in a sensible order if we switch
-        # to going through questions in a nested way rather than flat
-        def get_all_conditions(component: "Component") -> list["Expression"]:
-            conditions = []
-
-            # start outside and move in from top level conditions to innermost
-            if component.parent:
-                conditions.extend(get_all_conditions(component.parent))
-            conditions.extend(component.conditions)
-            return conditions
-
         try:
             if component.add_another_container and add_another_index is not None:
                 context = context.with_add_another_context(
                     component, submission_helper=self, add_another_index=add_another_index
                 )
 
-            return all(evaluate(condition, context) for condition in get_all_conditions(component))
+            return all(
+                evaluate(condition, context) for condition in self.cached_get_all_conditions_for_component(component)
+            )
 
         except UndefinedVariableInExpression:
             # todo: fail open for now - this method should accept an optional bool that allows this condition to fail
@@ -323,12 +373,32 @@ class SubmissionHelper:
             #       always suppressing errors and not surfacing issues on misconfigured forms
             return False
 
+    def _get_all_conditions_for_component(self, component: "Component") -> tuple["Expression", ...]:
+        # we can optimise this to exit early and do this in a sensible order if we switch
+        # to going through questions in a nested way rather than flat
+        components = []
+        current: "Component | None" = component
+        while current:
+            components.append(current)
+            current = current.parent
+
+        # start outside and move in from top level conditions to innermost
+        return tuple(condition for current in reversed(components) for condition in current.conditions)
+
     def _get_ordered_visible_questions(
         self, parent: Union["Form", "Group"], *, override_context: "ExpressionContext | None" = None
     ) -> list["Question"]:
         """Returns the visible, ordered questions based upon the current state of this collection."""
         context = override_context or self.cached_evaluation_context
-        return [question for question in parent.cached_questions if self.is_component_visible(question, context)]
+
+        # Most questions (and the groups they sit in) have no conditions at all, so they're always visible and we can
+        # skip evaluating anything for them.
+        return [
+            question
+            for question in parent.cached_questions
+            if not self.cached_get_all_conditions_for_component(question)
+            or self.is_component_visible(question, context)
+        ]
 
     def get_first_question_for_form(self, form: "Form") -> Optional["Question"]:
         questions = self.cached_get_ordered_visible_questions(form)
@@ -343,11 +413,12 @@ class SubmissionHelper:
         return None
 
     def get_form_for_question(self, question_id: UUID) -> "Form":
-        for form in self.collection.forms:
-            if any(q.id == question_id for q in form.cached_questions):
-                return form
-
-        raise ValueError(f"Could not find form for question_id={question_id} in collection={self.collection.id}")
+        try:
+            return self._forms_by_question_id[question_id]
+        except KeyError as e:
+            raise ValueError(
+                f"Could not find form for question_id={question_id} in collection={self.collection.id}"
+            ) from e
 
     def _get_answer_for_question(
         self, question_id: UUID, add_another_index: int | None = None
@@ -357,18 +428,15 @@ class SubmissionHelper:
         if question.add_another_container:
             if add_another_index is None:
                 raise ValueError("add_another_index must be provided for questions within an add another container")
-            if self.submission.data.get(str(question.add_another_container.id)) is None or add_another_index >= len(
-                self.submission.data.get(str(question.add_another_container.id), [])
-            ):
+            entries = self.submission.data.get(str(question.add_another_container.id))
+            if entries is None or add_another_index >= len(entries):
                 # we raise here instead of returning None as the consuming code should never ask for an answer to an
                 # add another entry that doesn't exist
                 raise ValueError("no add another entry exists at this index")
+            data_entry = entries[add_another_index]
+        else:
+            data_entry = self.submission.data
 
-        data_entry = (
-            self.submission.data
-            if not question.add_another_container
-            else self.submission.data.get(str(question.add_another_container.id), [])[add_another_index]
-        )
         serialised_data = data_entry.get(str(question_id))
         return _deserialise_question_type(question, serialised_data) if serialised_data is not None else None
 
@@ -388,6 +456,9 @@ class SubmissionHelper:
         )
         self.cached_get_answer_for_question.cache_clear()
         self.cached_get_all_questions_are_answered_for_form.cache_clear()
+        self.cached_get_status_for_form.cache_clear()
+        self.__dict__.pop("all_visible_questions", None)
+        self.__dict__.pop("submitted_at_utc", None)
 
         # FIXME: work out why end to end tests aren't happy without this here
         #        I've made it work but not happy with not clearly pointing to where
@@ -400,11 +471,12 @@ class SubmissionHelper:
 
         if self.all_forms_are_completed:
             interfaces.collections.add_submission_event(self.submission, SubmissionEventKey.SUBMISSION_SUBMITTED, user)
+            self._clear_event_caches()
         else:
             raise ValueError(f"Could not submit submission id={self.id} because not all forms are complete.")
 
     def toggle_form_completed(self, form: "Form", user: "User", is_complete: bool) -> None:
-        form_complete = self.get_status_for_form(form) == SubmissionStatusEnum.COMPLETED
+        form_complete = self.cached_get_status_for_form(form) == SubmissionStatusEnum.COMPLETED
         if is_complete == form_complete:
             return
 
@@ -423,6 +495,8 @@ class SubmissionHelper:
                 self.submission, SubmissionEventKey.FORM_RUNNER_FORM_COMPLETED, form
             )
 
+        self._clear_event_caches()
+
     # todo: decide if the add another index should be available submission helper wide where it just checks self
     #       does having it on lots of methods increase the cognitive load/ complexity
     def get_next_question(
@@ -444,12 +518,8 @@ class SubmissionHelper:
             form, override_context=context_override if context_override else None
         )
 
-        question_iterator = iter(questions)
-        for question in question_iterator:
-            if question.id == current_question_id:
-                return next(question_iterator, None)
-
-        raise ValueError(f"Could not find a question with id={current_question_id} in collection={self.collection}")
+        index = self._get_index_of_question(questions, question)
+        return questions[index + 1] if index + 1 < len(questions) else None
 
     def get_previous_question(
         self, current_question_id: UUID, add_another_index: int | None = None
@@ -471,13 +541,16 @@ class SubmissionHelper:
             form, override_context=context_override if context_override else None
         )
 
-        # Reverse the list of questions so that we're working from the end to the start.
-        question_iterator = iter(reversed(questions))
-        for question in question_iterator:
-            if question.id == current_question_id:
-                return next(question_iterator, None)
+        index = self._get_index_of_question(questions, question)
+        return questions[index - 1] if index > 0 else None
 
-        raise ValueError(f"Could not find a question with id={current_question_id} in collection={self.collection}")
+    def _get_index_of_question(self, questions: list["Question"], question: "Question") -> int:
+        # `list.index` compares by identity here, which is fine as `get_question` hands back the same instances that
+        # make up the form's questions, and it saves walking the list in Python.
+        try:
+            return questions.index(question)
+        except ValueError as e:
+            raise ValueError(f"Could not find a question with id={question.id} in collection={self.collection}") from e
 
     def get_answer_summary_for_add_another(
         self, component: "Component", *, add_another_index: int
@@ -522,6 +595,7 @@ class CollectionHelper:
     submission_mode: SubmissionModeEnum
     submissions: List["Submission"]
     submission_helpers: dict[UUID, SubmissionHelper]
+    submission_helpers_by_reference: dict[str, SubmissionHelper]
 
     def __init__(self, collection: "Collection", submission_mode: SubmissionModeEnum):
         self.collection = collection
@@ -530,6 +604,7 @@ class CollectionHelper:
             s for s in (get_all_submissions_with_mode_for_collection_with_full_schema(collection.id, submission_mode))
         ]
         self.submission_helpers = {s.id: SubmissionHelper(s) for s in self.submissions}
+        self.submission_helpers_by_reference = {helper.reference: helper for helper in self.submission_helpers.values()}
 
         self.grant_recipients = self.collection.grant.grant_recipients
         self.grant_recipients_submission_helpers: dict[UUID, SubmissionHelper | None] = {
@@ -549,20 +624,17 @@ class CollectionHelper:
         return self.submission_helpers.get(submission_id, None)
 
     def get_submission_helper_by_reference(self, submission_reference: str) -> SubmissionHelper | None:
-        for _, submission in self.submission_helpers.items():
-            if submission.reference == submission_reference:
-                return submission
-
-        return None
+        return self.submission_helpers_by_reference.get(submission_reference, None)
 
-    def get_all_possible_questions_for_collection(self) -> list["Question"]:
+    @cached_property
+    def all_possible_questions_for_collection(self) -> list["Question"]:
         """
         Returns a list of all questions that are part of the collection, across all forms.
         """
         return [
             question
-            for form in sorted(self.collection.forms, key=lambda f: f.order)
-            for question in sorted(form.cached_questions, key=lambda q: q.order)
+            for form in sorted(self.collection.forms, key=attrgetter("order"))
+            for question in sorted(form.cached_questions, key=attrgetter("order"))
         ]
 
     # todo: split this method up into smaller parts that can be individually tested (i.e submission -> CSV row dict)
@@ -570,13 +642,13 @@ class CollectionHelper:
         metadata_headers = ["Submission reference", "Created by", "Created at", "Status", "Submitted at"]
 
         question_headers: list[tuple["Question", str, int | None]] = []
-        processed_add_another_contexts = []
-        for question in self.get_all_possible_questions_for_collection():
+        processed_add_another_contexts: set["Component"] = set()
+        for question in self.all_possible_questions_for_collection:
             if not question.add_another_container:
                 question_headers.append((question, f"[{question.form.title}] {question.name}", None))
             else:
                 if question.add_another_container not in processed_add_another_contexts:
-                    processed_add_another_contexts.append(question.add_another_container)
+                    processed_add_another_contexts.add(question.add_another_container)
 
                     # if its an add another question context we need to know the count to make the
                     # maximum number of headers
@@ -607,32 +679,32 @@ class CollectionHelper:
         all_headers = metadata_headers + [header_string for (_, header_string, _) in question_headers]
 
         csv_output = StringIO()
-        csv_writer = csv.DictWriter(csv_output, fieldnames=all_headers)
-        csv_writer.writeheader()
-        for submission in [value for key, value in self.submission_helpers.items()]:
-            submission_csv_data = {
-                "Submission reference": submission.reference,
-                "Created by": submission.created_by_email,
-                "Created at": format_datetime(submission.created_at_utc),
-                "Status": submission.status,
-                "Submitted at": format_datetime(submission.submitted_at_utc) if submission.submitted_at_utc else None,
-            }
+        csv_writer = csv.writer(csv_output)
+        csv_writer.writerow(all_headers)
+        for submission in self.submission_helpers.values():
+            # Cells are appended in the same order as `all_headers`, so we can write each row as a plain list rather
+            # than building a dict for `csv.DictWriter` to look every header back up in.
+            row: list[Any] = [
+                submission.reference,
+                submission.created_by_email,
+                format_datetime(submission.created_at_utc),
+                submission.status,
+                format_datetime(submission.submitted_at_utc) if submission.submitted_at_utc else None,
+            ]
             visible_questions = submission.all_visible_questions
             cached_contexts: dict[str, "ExpressionContext"] = {}
-            for question, header_string, index in question_headers:
+            for question, _, index in question_headers:
                 if not question.add_another_container:
-                    if question.id not in visible_questions.keys():
-                        submission_csv_data[header_string] = NOT_ASKED
+                    if question.id not in visible_questions:
+                        row.append(NOT_ASKED)
                     else:
                         answer = submission.cached_get_answer_for_question(question.id)
-                        submission_csv_data[header_string] = (
-                            answer.get_value_for_text_export() if answer is not None else NOT_ANSWERED
-                        )
+                        row.append(answer.get_value_for_text_export() if answer is not None else NOT_ANSWERED)
                 else:
                     assert index is not None
                     if submission.get_count_for_add_another(question.add_another_container) <= index:
                         # this submission didn't provide this many answers as so wasn't asked this question
-                        submission_csv_data[header_string] = NOT_ASKED
+                        row.append(NOT_ASKED)
                     else:
                         context_key = f"{question.add_another_container.id}{index}"
                         context = cached_contexts.get(context_key)
@@ -646,13 +718,11 @@ class CollectionHelper:
 
                         if submission.is_component_visible(question, context):
                             answer = submission.cached_get_answer_for_question(question.id, add_another_index=index)
-                            submission_csv_data[header_string] = (
-                                answer.get_value_for_text_export() if answer is not None else NOT_ANSWERED
-                            )
+                            row.append(answer.get_value_for_text_export() if answer is not None else NOT_ANSWERED)
                         else:
-                            submission_csv_data[header_string] = NOT_ASKED
+                            row.append(NOT_ASKED)
 
-            csv_writer.writerow(submission_csv_data)
+            csv_writer.writerow(row)
 
         return csv_output.getvalue()
 
@@ -734,25 +804,23 @@ def _form_data_to_question_type(question: "Question", form: DynamicQuestionForm)
     raise ValueError(f"Could not parse data for question type={question.data_type}")
 
 
+# Building a `TypeAdapter` is several times more expensive than validating with one, and we deserialise every answer
+# in a submission (or in every submission, when exporting), so build one per question type up front.
+_ANSWER_TYPE_ADAPTERS: dict[QuestionDataType, TypeAdapter[Any]] = {
+    QuestionDataType.TEXT_SINGLE_LINE: TypeAdapter(TextSingleLineAnswer),
+    QuestionDataType.URL: TypeAdapter(UrlAnswer),
+    QuestionDataType.EMAIL: TypeAdapter(EmailAnswer),
+    QuestionDataType.TEXT_MULTI_LINE: TypeAdapter(TextMultiLineAnswer),
+    QuestionDataType.INTEGER: TypeAdapter(IntegerAnswer),
+    QuestionDataType.YES_NO: TypeAdapter(YesNoAnswer),
+    QuestionDataType.RADIOS: TypeAdapter(SingleChoiceFromListAnswer),
+    QuestionDataType.CHECKBOXES: TypeAdapter(MultipleChoiceFromListAnswer),
+    QuestionDataType.DATE: TypeAdapter(DateAnswer),
+}
+
+
 def _deserialise_question_type(question: "Question", serialised_data: str | int | float | bool) -> AllAnswerTypes:
-    match question.data_type:
-        case QuestionDataType.TEXT_SINGLE_LINE:
-            return TypeAdapter(TextSingleLineAnswer).validate_python(serialised_data)
-        case QuestionDataType.URL:
-            return TypeAdapter(UrlAnswer).validate_python(serialised_data)
-        case QuestionDataType.EMAIL:
-            return TypeAdapter(EmailAnswer).validate_python(serialised_data)
-        case QuestionDataType.TEXT_MULTI_LINE:
-            return TypeAdapter(TextMultiLineAnswer).validate_python(serialised_data)
-        case QuestionDataType.INTEGER:
-            return TypeAdapter(IntegerAnswer).validate_python(serialised_data)
-        case QuestionDataType.YES_NO:
-            return TypeAdapter(YesNoAnswer).validate_python(serialised_data)
-        case QuestionDataType.RADIOS:
-            return TypeAdapter(SingleChoiceFromListAnswer).validate_python(serialised_data)
-        case QuestionDataType.CHECKBOXES:
-            return TypeAdapter(MultipleChoiceFromListAnswer).validate_python(serialised_data)
-        case QuestionDataType.DATE:
-            return TypeAdapter(DateAnswer).validate_python(serialised_data)
+    if adapter := _ANSWER_TYPE_ADAPTERS.get(question.data_type):
+        return cast(AllAnswerTypes, adapter.validate_python(serialised_data))
 
     raise ValueError(f"Could not deserialise data for question type={question.data_type}")
@@ -1,11 +1,10 @@
-import copy
 import os
 import urllib.parse
 from enum import Enum
 from typing import Any, Self, Tuple
 
 from flask_talisman.talisman import ONE_YEAR_IN_SECS
-from pydantic import BaseModel, PostgresDsn, model_validator
+from pydantic import BaseModel, Field, PostgresDsn, field_validator, model_validator
 from pydantic_settings import BaseSettings, PydanticBaseSettingsSource
 
 from app.common.data.types import OrganisationType
@@ -47,8 +46,14 @@ FS_CONTENT_SECURITY_POLICY = {
 }
 
 
+def copy_csp(csp: dict[str, list[str]]) -> dict[str, list[str]]:
+    # Every value is a flat list of strings, so copying each list is all `copy.deepcopy` would do here. Config classes
+    # use this as a `default_factory` so that pydantic doesn't deepcopy the policy for each instance itself.
+    return {directive: list(sources) for directive, sources in csp.items()}
+
+
 def make_development_csp() -> dict[str, list[str]]:
-    csp = copy.deepcopy(FS_CONTENT_SECURITY_POLICY)
+    csp = copy_csp(FS_CONTENT_SECURITY_POLICY)
     csp["default-src"].extend(
         [
             "http://localhost:5173",  # Vite assets
@@ -80,6 +85,9 @@ def make_development_csp() -> dict[str, list[str]]:
     return csp
 
 
+DEVELOPMENT_CONTENT_SECURITY_POLICY = make_development_csp()
+
+
 class _BaseConfig(BaseSettings):
     """
     Stop pydantic-settings from reading configuration from anywhere other than the environment.
@@ -155,7 +163,9 @@ class _SharedConfig(_BaseConfig):
     TALISMAN_STRICT_TRANSPORT_SECURITY_PRELOAD: bool = True
     TALISMAN_STRICT_TRANSPORT_SECURITY_MAX_AGE: int = ONE_YEAR_IN_SECS
     TALISMAN_STRICT_TRANSPORT_SECURITY_INCLUDE_SUBDOMAINS: bool = True
-    TALISMAN_CONTENT_SECURITY_POLICY: dict[str, list[str]] = copy.deepcopy(FS_CONTENT_SECURITY_POLICY)
+    TALISMAN_CONTENT_SECURITY_POLICY: dict[str, list[str]] = Field(
+        default_factory=lambda: copy_csp(FS_CONTENT_SECURITY_POLICY)
+    )
     TALISMAN_CONTENT_SECURITY_POLICY_REPORT_URI: str | None = None
     TALISMAN_CONTENT_SECURITY_POLICY_REPORT_ONLY: bool = False
     TALISMAN_CONTENT_SECURITY_POLICY_NONCE_IN: list[str] = ["img-src", "script-src", "style-src"]
@@ -261,6 +271,12 @@ class _SharedConfig(_BaseConfig):
     # Internal Domains
     INTERNAL_DOMAINS: tuple[str, ...] = ("@communities.gov.uk", "@test.communities.gov.uk")
 
+    @field_validator("INTERNAL_DOMAINS", mode="after")
+    @classmethod
+    def lowercase_internal_domains(cls, value: tuple[str, ...]) -> tuple[str, ...]:
+        # Normalised once here so that checks against user-provided email addresses only need to lowercase the email.
+        return tuple(domain.lower() for domain in value)
+
     # Service Desk
     SERVICE_DESK_URL: str = "https://mhclgdigital.atlassian.net/servicedesk/customer/portal/5"
     ACCESS_SERVICE_DESK_URL: str = "https://mhclgdigital.atlassian.net/servicedesk/customer/portal/5/group/1344"
@@ -319,7 +335,9 @@ class LocalConfig(_SharedConfig):
     AZURE_AD_BASE_URL: str = "https://sso.communities.gov.localhost:4005/"
 
     # Talisman security settings
-    TALISMAN_CONTENT_SECURITY_POLICY: dict[str, list[str]] = make_development_csp()
+    TALISMAN_CONTENT_SECURITY_POLICY: dict[str, list[str]] = Field(
+        default_factory=lambda: copy_csp(DEVELOPMENT_CONTENT_SECURITY_POLICY)
+    )
 
     # Our `record_sqlalchemy_queries` extension`
     RECORD_SQLALCHEMY_QUERIES: bool = True
@@ -385,7 +403,9 @@ class PullPreviewConfig(_SharedConfig):
     AZURE_AD_BASE_URL: str = os.getenv("AZURE_AD_BASE_URL", "https://sso.communities.gov.localhost:4005/")
 
     # Talisman security settings
-    TALISMAN_CONTENT_SECURITY_POLICY: dict[str, list[str]] = make_development_csp()
+    TALISMAN_CONTENT_SECURITY_POLICY: dict[str, list[str]] = Field(
+        default_factory=lambda: copy_csp(DEVELOPMENT_CONTENT_SECURITY_POLICY)
+    )
 
 
 class TestConfig(_SharedConfig):
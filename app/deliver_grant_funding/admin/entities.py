@@ -5,7 +5,7 @@ from flask import current_app, flash
 from flask_admin.actions import action
 from flask_admin.helpers import is_form_submitted
 from flask_babel import ngettext
-from sqlalchemy import delete, func, orm, select, update
+from sqlalchemy import ScalarResult, delete, func, orm, select, update
 from sqlalchemy.exc import IntegrityError
 from wtforms import Form
 from wtforms.validators import Email
@@ -20,6 +20,14 @@ from app.deliver_grant_funding.admin.mixins import FlaskAdminPlatformAdminAccess
 from app.extensions import db, notification_service
 
 
+def _get_organisations_that_can_manage_grants() -> ScalarResult[Organisation]:
+    return db.session.scalars(select(Organisation).where(Organisation.can_manage_grants.is_(True)))
+
+
+def _get_organisations_that_cannot_manage_grants() -> ScalarResult[Organisation]:
+    return db.session.scalars(select(Organisation).where(Organisation.can_manage_grants.is_(False)))
+
+
 class PlatformAdminModelView(FlaskAdminPlatformAdminAccessibleMixin, XGovukModelView):
     page_size = 50
     can_set_page_size = True
@@ -88,7 +96,10 @@ class PlatformAdminUserView(PlatformAdminModelView):
             return
 
         try:
-            self.session.execute(delete(UserRole).where(UserRole.user_id.in_(ids)))
+            # We commit straight away, which expires everything in the session, so there's nothing to synchronise.
+            self.session.execute(
+                delete(UserRole).where(UserRole.user_id.in_(ids)).execution_options(synchronize_session=False)
+            )
             self.session.commit()
             current_app.logger.warning(
                 "%(name)s revoked all user permissions for user(s): %(user_ids)s",
@@ -184,7 +195,7 @@ class PlatformAdminGrantView(PlatformAdminModelView):
     form_args = {
         "organisation": {
             "get_label": "name",
-            "query_factory": lambda: db.session.query(Organisation).filter_by(can_manage_grants=True),
+            "query_factory": _get_organisations_that_can_manage_grants,
         },
     }
 
@@ -229,8 +240,9 @@ class PlatformAdminInvitationView(PlatformAdminModelView):
             # Make new invitations last 1 hour by default, since these invitations are very privileged.
             model.expires_at_utc = func.now() + datetime.timedelta(hours=1)
 
-            if user := self.session.scalar(select(User).where(User.email == form.email.data)):  # type: ignore[attr-defined]
-                model.user = user
+            # We only need to link the invitation to an existing user, so there's no need to load the whole user.
+            if user_id := self.session.scalar(select(User.id).where(User.email == form.email.data)):  # type: ignore[attr-defined]
+                model.user_id = user_id
 
         return super().on_model_change(form, model, is_created)  # type: ignore[no-any-return]
 
@@ -287,14 +299,15 @@ class PlatformAdminInvitationView(PlatformAdminModelView):
             return
 
         try:
-            usable_invitations = (
-                self.session.execute(select(Invitation.id).where(Invitation.id.in_(ids), Invitation.is_usable))
-                .scalars()
-                .all()
-            )
-            self.session.execute(
-                update(Invitation).where(Invitation.id.in_(usable_invitations)).values(expires_at_utc=func.now())
-            )
+            # Expire the usable invitations and find out which ones they were in a single statement. As above, we commit
+            # straight away so there's nothing in the session to synchronise.
+            usable_invitations = self.session.scalars(
+                update(Invitation)
+                .where(Invitation.id.in_(ids), Invitation.is_usable)
+                .values(expires_at_utc=func.now())
+                .returning(Invitation.id)
+                .execution_options(synchronize_session=False)
+            ).all()
             self.session.commit()
             if usable_invitations:
                 current_app.logger.warning(
@@ -345,6 +358,6 @@ class PlatformAdminGrantRecipientView(PlatformAdminModelView):
         },
         "organisation": {
             "get_label": "name",
-            "query_factory": lambda: db.session.query(Organisation).filter_by(can_manage_grants=False),
+            "query_factory": _get_organisations_that_cannot_manage_grants,
         },
     }
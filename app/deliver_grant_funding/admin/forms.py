@@ -1,5 +1,7 @@
 import csv
 import datetime
+import io
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Mapping, Sequence
 
 from flask import current_app
@@ -18,6 +20,33 @@ if TYPE_CHECKING:
     from app.common.data.models import Collection, Grant, GrantRecipient, Organisation
     from app.common.data.models_user import UserRole
 
+ORGANISATIONS_TSV_HEADER = "organisation-id\torganisation-name\ttype\tactive-date\tretirement-date"
+GRANT_RECIPIENT_USERS_TSV_HEADER = "organisation-name\tfull-name\temail-address"
+
+
+def _parse_tsv_date(value: str) -> datetime.date | None:
+    """
+    Parses a DD/MM/YYYY date from pasted TSV data, treating an empty cell as no date.
+
+    This is equivalent to `strptime(value, "%d/%m/%Y")` for the dates we get from Delta, but avoids its locale-aware
+    parsing, which is most of the cost of processing a large paste.
+    """
+    if not value:
+        return None
+
+    parts = value.split("/")
+    if (
+        len(parts) != 3
+        or not all(part.isdecimal() for part in parts)
+        or len(parts[0]) > 2
+        or len(parts[1]) > 2
+        or len(parts[2]) != 4
+    ):
+        raise ValueError(f"time data {value!r} does not match format '%d/%m/%Y'")
+
+    day, month, year = parts
+    return datetime.date(int(year), int(month), int(day))
+
 
 class PlatformAdminSelectGrantForReportingLifecycleForm(FlaskForm):
     grant_id = SelectField(
@@ -31,7 +60,7 @@ class PlatformAdminSelectGrantForReportingLifecycleForm(FlaskForm):
     def __init__(self, grants: Sequence["Grant"]) -> None:
         super().__init__()
 
-        self.grant_id.choices = [("", "")] + [(str(grant.id), grant.name) for grant in grants]  # type: ignore[assignment]
+        self.grant_id.choices = [("", ""), *((str(grant.id), grant.name) for grant in grants)]
 
 
 class PlatformAdminSelectReportForm(FlaskForm):
@@ -46,7 +75,10 @@ class PlatformAdminSelectReportForm(FlaskForm):
     def __init__(self, collections: Sequence["Collection"]) -> None:
         super().__init__()
 
-        self.collection_id.choices = [("", "")] + [(str(collection.id), collection.name) for collection in collections]  # type: ignore[assignment]
+        self.collection_id.choices = [
+            ("", ""),
+            *((str(collection.id), collection.name) for collection in collections),
+        ]
 
 
 class PlatformAdminMakeGrantLiveForm(FlaskForm):
@@ -63,7 +95,7 @@ class PlatformAdminBulkCreateOrganisationsForm(FlaskForm):
     # the text box.
     organisations_data = TextAreaField(
         "Organisation TSV data",
-        default="organisation-id\torganisation-name\ttype\tactive-date\tretirement-date\n",
+        default=f"{ORGANISATIONS_TSV_HEADER}\n",
         validators=[DataRequired()],
         widget=GovTextArea(),
     )
@@ -72,10 +104,11 @@ class PlatformAdminBulkCreateOrganisationsForm(FlaskForm):
     def validate_organisations_data(self, field: TextAreaField) -> None:
         assert field.data
 
-        if field.data.splitlines()[0] != "organisation-id\torganisation-name\ttype\tactive-date\tretirement-date":
-            field.errors.append(  # type: ignore[attr-defined]
-                "The header row must be exactly: organisation-id\torganisation-name\ttype\tactive-date\tretirement-date"
-            )
+        # Only look at the first line, rather than splitting what could be a very large paste into lines to do so.
+        header, _, _ = field.data.partition("\n")
+        if header.rstrip("\r") != ORGANISATIONS_TSV_HEADER:
+            field.errors.append(f"The header row must be exactly: {ORGANISATIONS_TSV_HEADER}")  # type: ignore[attr-defined]
+            return
 
         try:
             self.get_normalised_organisation_data()
@@ -83,17 +116,22 @@ class PlatformAdminBulkCreateOrganisationsForm(FlaskForm):
             field.errors.append(f"The tab-separated data is not valid: {str(e)}")  # type: ignore[attr-defined]
 
     def get_normalised_organisation_data(self) -> list["OrganisationData"]:
+        return self._normalised_organisation_data
+
+    # Parsed once and shared between validation and the view that then processes the same data.
+    @cached_property
+    def _normalised_organisation_data(self) -> list["OrganisationData"]:
         assert self.organisations_data.data
         organisations_data = self.organisations_data.data
-        tsv_reader = csv.reader(organisations_data.splitlines(), delimiter="\t")
+        tsv_reader = csv.reader(io.StringIO(organisations_data, newline=""), delimiter="\t")
         _ = next(tsv_reader)  # Skip the header
         normalised_organisations = [
             OrganisationData(
                 external_id=row[0],
                 name=row[1],
                 type=OrganisationType(row[2]),
-                active_date=datetime.datetime.strptime(row[3], "%d/%m/%Y") if row[3] else None,
-                retirement_date=datetime.datetime.strptime(row[4], "%d/%m/%Y") if row[4] else None,
+                active_date=_parse_tsv_date(row[3]),
+                retirement_date=_parse_tsv_date(row[4]),
             )
             for row in tsv_reader
         ]
@@ -111,7 +149,7 @@ class PlatformAdminBulkCreateGrantRecipientsForm(FlaskForm):
         self, organisations: Sequence["Organisation"], existing_grant_recipients: Sequence["GrantRecipient"]
     ) -> None:
         super().__init__()
-        existing_grant_recipient_org_ids = {gr.organisation.id for gr in existing_grant_recipients}
+        existing_grant_recipient_org_ids = {gr.organisation_id for gr in existing_grant_recipients}
         self.recipients.choices = [
             (str(org.id), org.name) for org in organisations if org.id not in existing_grant_recipient_org_ids
         ]
@@ -120,15 +158,14 @@ class PlatformAdminBulkCreateGrantRecipientsForm(FlaskForm):
 class PlatformAdminCreateGrantRecipientUserForm(FlaskForm):
     users_data = TextAreaField(
         "Grant recipient users TSV data",
-        default="organisation-name\tfull-name\temail-address\n",
+        default=f"{GRANT_RECIPIENT_USERS_TSV_HEADER}\n",
         validators=[DataRequired()],
         widget=GovTextArea(),
     )
     submit = SubmitField("Set up grant recipient users", widget=GovSubmitInput())
 
-    def __init__(self, grant_recipients: Sequence["GrantRecipient"]) -> None:
+    def __init__(self) -> None:
         super().__init__()
-        self.grant_recipients = grant_recipients
 
         self.users_data.description = Markup(
             "<span>Copy and paste the 'Funding service ingest' table from the "
@@ -141,10 +178,9 @@ class PlatformAdminCreateGrantRecipientUserForm(FlaskForm):
     def validate_users_data(self, field: TextAreaField) -> None:
         assert field.data
 
-        if field.data.splitlines()[0] != "organisation-name\tfull-name\temail-address":
-            field.errors.append(  # type: ignore[attr-defined]
-                "The header row must be exactly: organisation-name\tfull-name\temail-address"
-            )
+        header, _, _ = field.data.partition("\n")
+        if header.rstrip("\r") != GRANT_RECIPIENT_USERS_TSV_HEADER:
+            field.errors.append(f"The header row must be exactly: {GRANT_RECIPIENT_USERS_TSV_HEADER}")  # type: ignore[attr-defined]
             return
 
         try:
@@ -153,15 +189,22 @@ class PlatformAdminCreateGrantRecipientUserForm(FlaskForm):
             field.errors.append(f"The tab-separated data is not valid: {str(e)}")  # type: ignore[attr-defined]
             return
 
-        # Validate email addresses
-        from wtforms.validators import Email as EmailValidator
+        # Validate email addresses. We call `email_validator` directly, with the same options as WTForms' `Email`
+        # validator, rather than building a field-like object for every row just to pass through that validator.
+        from email_validator import EmailNotValidError, validate_email
 
-        email_validator = EmailValidator()
+        # The same person is often listed against several organisations, so only check each address once.
+        is_valid_email: dict[str, bool] = {}
         invalid_emails = []
         for _, _, email_address in users_data:
-            try:
-                email_validator(self, type("obj", (), {"data": email_address})())
-            except Exception:
+            if email_address not in is_valid_email:
+                try:
+                    validate_email(email_address, check_deliverability=False)
+                    is_valid_email[email_address] = True
+                except EmailNotValidError:
+                    is_valid_email[email_address] = False
+
+            if not is_valid_email[email_address]:
                 invalid_emails.append(email_address)
 
         if invalid_emails:
@@ -170,9 +213,14 @@ class PlatformAdminCreateGrantRecipientUserForm(FlaskForm):
             )
 
     def get_normalised_users_data(self) -> list[tuple[str, str, str]]:
+        return self._normalised_users_data
+
+    # Parsed once and shared between validation and the view that then processes the same data.
+    @cached_property
+    def _normalised_users_data(self) -> list[tuple[str, str, str]]:
         assert self.users_data.data
         users_data = self.users_data.data
-        tsv_reader = csv.reader(users_data.splitlines(), delimiter="\t")
+        tsv_reader = csv.reader(io.StringIO(users_data, newline=""), delimiter="\t")
         _ = next(tsv_reader)  # Skip the header
         normalised_users = [(row[0], row[1], row[2]) for row in tsv_reader]
         return normalised_users
@@ -228,49 +276,47 @@ class PlatformAdminSetCollectionDatesForm(FlaskForm):
     def validate(self, extra_validators: Mapping[str, Sequence[Any]] | None = None) -> bool:
         result: bool = super().validate(extra_validators)
 
-        if (self.reporting_period_start_date.data or self.reporting_period_end_date.data) and not (
-            self.reporting_period_start_date.data and self.reporting_period_end_date.data
-        ):
+        reporting_start = self.reporting_period_start_date.data
+        reporting_end = self.reporting_period_end_date.data
+        submission_start = self.submission_period_start_date.data
+        submission_end = self.submission_period_end_date.data
+
+        if bool(reporting_start) != bool(reporting_end):
             self.reporting_period_start_date.errors.append("Set both a reporting start and end date, or neither")  # type: ignore[attr-defined]
             self.reporting_period_end_date.errors.append("Set both a reporting start and end date, or neither")  # type: ignore[attr-defined]
             return False
 
-        if (self.submission_period_start_date.data or self.submission_period_end_date.data) and not (
-            self.submission_period_start_date.data and self.submission_period_end_date.data
-        ):
+        if bool(submission_start) != bool(submission_end):
             self.submission_period_start_date.errors.append("Set both a submission start and end date, or neither")  # type: ignore[attr-defined]
             self.submission_period_end_date.errors.append("Set both a submission start and end date, or neither")  # type: ignore[attr-defined]
             return False
 
-        if self.reporting_period_start_date.data and self.reporting_period_end_date.data:
-            if self.reporting_period_start_date.data >= self.reporting_period_end_date.data:
-                self.reporting_period_start_date.errors.append(  # type: ignore[attr-defined]
-                    "report period start date must be before reporting period end date"
-                )
-                self.reporting_period_end_date.errors.append(  # type: ignore[attr-defined]
-                    "report period end date must be after reporting period start date"
-                )
-                return False
-
-        if self.submission_period_start_date.data and self.submission_period_end_date.data:
-            if self.submission_period_start_date.data >= self.submission_period_end_date.data:
-                self.submission_period_start_date.errors.append(  # type: ignore[attr-defined]
-                    "Submission period start date must be before submission period end date"
-                )
-                self.submission_period_end_date.errors.append(  # type: ignore[attr-defined]
-                    "Submission period start date must be before submission period end date"
-                )
-                return False
-
-        if self.reporting_period_end_date.data and self.submission_period_start_date.data:
-            if self.reporting_period_end_date.data >= self.submission_period_start_date.data:
-                self.reporting_period_end_date.errors.append(  # type: ignore[attr-defined]
-                    "Report period end date must be before submission period start date"
-                )
-                self.submission_period_start_date.errors.append(  # type: ignore[attr-defined]
-                    "Report period end date must be before submission period start date"
-                )
-                return False
+        if reporting_start and reporting_end and reporting_start >= reporting_end:
+            self.reporting_period_start_date.errors.append(  # type: ignore[attr-defined]
+                "report period start date must be before reporting period end date"
+            )
+            self.reporting_period_end_date.errors.append(  # type: ignore[attr-defined]
+                "report period end date must be after reporting period start date"
+            )
+            return False
+
+        if submission_start and submission_end and submission_start >= submission_end:
+            self.submission_period_start_date.errors.append(  # type: ignore[attr-defined]
+                "Submission period start date must be before submission period end date"
+            )
+            self.submission_period_end_date.errors.append(  # type: ignore[attr-defined]
+                "Submission period start date must be before submission period end date"
+            )
+            return False
+
+        if reporting_end and submission_start and reporting_end >= submission_start:
+            self.reporting_period_end_date.errors.append(  # type: ignore[attr-defined]
+                "Report period end date must be before submission period start date"
+            )
+            self.submission_period_start_date.errors.append(  # type: ignore[attr-defined]
+                "Report period end date must be before submission period start date"
+            )
+            return False
 
         return result
 
@@ -4,7 +4,7 @@ from uuid import UUID
 from flask import current_app, flash, redirect, url_for
 from flask_admin import AdminIndexView, BaseView, expose
 
-from app.common.data.interfaces.collections import get_collection, update_collection
+from app.common.data.interfaces.collections import get_collection, get_collection_ids, update_collection
 from app.common.data.interfaces.exceptions import (
     CollectionChronologyError,
     GrantMustBeLiveToScheduleReportError,
@@ -14,18 +14,18 @@ from app.common.data.interfaces.exceptions import (
 )
 from app.common.data.interfaces.grant_recipients import (
     create_grant_recipients,
+    get_grant_recipient_organisation_ids_by_name,
     get_grant_recipient_user_roles,
     get_grant_recipient_users_by_organisation,
-    get_grant_recipient_users_count,
     get_grant_recipients,
-    get_grant_recipients_count,
-    revoke_grant_recipient_user_role,
+    get_reporting_lifecycle_counts,
+    revoke_grant_recipient_user_roles,
 )
 from app.common.data.interfaces.grants import get_all_grants, get_grant, update_grant
-from app.common.data.interfaces.organisations import get_organisation_count, get_organisations, upsert_organisations
+from app.common.data.interfaces.organisations import get_organisations, upsert_organisations
 from app.common.data.interfaces.user import (
-    upsert_user_by_email,
-    upsert_user_role,
+    upsert_user_roles,
+    upsert_users_by_email,
 )
 from app.common.data.types import CollectionStatusEnum, CollectionType, GrantStatusEnum, RoleEnum
 from app.deliver_grant_funding.admin.forms import (
@@ -57,19 +57,19 @@ class PlatformAdminReportingLifecycleView(PlatformAdminBaseView):
     def index(self) -> Any:
         form = PlatformAdminSelectGrantForReportingLifecycleForm(grants=get_all_grants())
         if form.validate_on_submit():
-            grant = get_grant(form.grant_id.data, with_all_collections=True)
-            if len(grant.reports) == 1:
-                return redirect(
-                    url_for("reporting_lifecycle.tasklist", grant_id=grant.id, collection_id=grant.reports[0].id)
-                )
+            grant_id = UUID(form.grant_id.data)
+            # We only need to know whether the grant has exactly one report, so there's no need to fetch more than two.
+            report_ids = get_collection_ids(grant_id, type_=CollectionType.MONITORING_REPORT, limit=2)
+            if len(report_ids) == 1:
+                return redirect(url_for("reporting_lifecycle.tasklist", grant_id=grant_id, collection_id=report_ids[0]))
             else:
-                return redirect(url_for("reporting_lifecycle.select_report", grant_id=grant.id))
+                return redirect(url_for("reporting_lifecycle.select_report", grant_id=grant_id))
 
         return self.render("deliver_grant_funding/admin/select-grant-for-reporting-lifecycle.html", form=form)
 
     @expose("/<uuid:grant_id>/select-report", methods=["GET", "POST"])  # type: ignore[misc]
     def select_report(self, grant_id: UUID) -> Any:
-        grant = get_grant(grant_id, with_all_collections=True)
+        grant = get_grant(grant_id)
         form = PlatformAdminSelectReportForm(collections=grant.reports)
         if form.validate_on_submit():
             return redirect(
@@ -82,25 +82,23 @@ class PlatformAdminReportingLifecycleView(PlatformAdminBaseView):
 
     @expose("/<uuid:grant_id>/<uuid:collection_id>")  # type: ignore[misc]
     def tasklist(self, grant_id: UUID, collection_id: UUID) -> Any:
-        grant = get_grant(grant_id, with_all_collections=True)
-        collection = get_collection(collection_id, grant_id=grant_id)
-        organisation_count = get_organisation_count()
-        grant_recipients_count = get_grant_recipients_count(grant=grant)
-        grant_recipient_users_count = get_grant_recipient_users_count(grant=grant)
+        collection = get_collection(collection_id, grant_id=grant_id, with_grant=True)
+        grant = collection.grant
+        counts = get_reporting_lifecycle_counts(grant=grant)
         return self.render(
             "deliver_grant_funding/admin/reporting-lifecycle-tasklist.html",
             grant=grant,
             collection=collection,
-            organisation_count=organisation_count,
-            grant_recipients_count=grant_recipients_count,
-            grant_recipient_users_count=grant_recipient_users_count,
+            organisation_count=counts.organisations,
+            grant_recipients_count=counts.grant_recipients,
+            grant_recipient_users_count=counts.grant_recipient_users,
         )
 
     @expose("/<uuid:grant_id>/<uuid:collection_id>/make-live", methods=["GET", "POST"])  # type: ignore[misc]
     @auto_commit_after_request
     def make_live(self, grant_id: UUID, collection_id: UUID) -> Any:
-        grant = get_grant(grant_id)
-        collection = get_collection(collection_id, grant_id=grant_id)
+        collection = get_collection(collection_id, grant_id=grant_id, with_grant=True)
+        grant = collection.grant
 
         if grant.status == GrantStatusEnum.LIVE:
             flash(f"{grant.name} is already live.")
@@ -122,8 +120,8 @@ class PlatformAdminReportingLifecycleView(PlatformAdminBaseView):
     @expose("/<uuid:grant_id>/<uuid:collection_id>/mark-as-onboarding", methods=["GET", "POST"])  # type: ignore[misc]
     @auto_commit_after_request
     def mark_as_onboarding(self, grant_id: UUID, collection_id: UUID) -> Any:
-        grant = get_grant(grant_id)
-        collection = get_collection(collection_id, grant_id=grant_id)
+        collection = get_collection(collection_id, grant_id=grant_id, with_grant=True)
+        grant = collection.grant
 
         if grant.status in [GrantStatusEnum.ONBOARDING, GrantStatusEnum.LIVE]:
             flash(f"{grant.name} is already marked as onboarding.")
@@ -145,8 +143,8 @@ class PlatformAdminReportingLifecycleView(PlatformAdminBaseView):
     @expose("/<uuid:grant_id>/<uuid:collection_id>/set-up-organisations", methods=["GET", "POST"])  # type: ignore[misc]
     @auto_commit_after_request
     def set_up_organisations(self, grant_id: UUID, collection_id: UUID) -> Any:
-        grant = get_grant(grant_id)
-        collection = get_collection(collection_id, grant_id=grant_id)
+        collection = get_collection(collection_id, grant_id=grant_id, with_grant=True)
+        grant = collection.grant
         form = PlatformAdminBulkCreateOrganisationsForm()
         if form.validate_on_submit():
             organisations = form.get_normalised_organisation_data()
@@ -165,8 +163,8 @@ class PlatformAdminReportingLifecycleView(PlatformAdminBaseView):
     @expose("/<uuid:grant_id>/<uuid:collection_id>/set-up-grant-recipients", methods=["GET", "POST"])  # type: ignore[misc]
     @auto_commit_after_request
     def set_up_grant_recipients(self, grant_id: UUID, collection_id: UUID) -> Any:
-        grant = get_grant(grant_id)
-        collection = get_collection(collection_id, grant_id=grant_id)
+        collection = get_collection(collection_id, grant_id=grant_id, with_grant=True)
+        grant = collection.grant
         organisations = get_organisations(can_manage_grants=False)
         existing_grant_recipients = get_grant_recipients(grant=grant)
         form = PlatformAdminBulkCreateGrantRecipientsForm(
@@ -189,40 +187,46 @@ class PlatformAdminReportingLifecycleView(PlatformAdminBaseView):
     @expose("/<uuid:grant_id>/<uuid:collection_id>/set-up-grant-recipient-users", methods=["GET", "POST"])  # type: ignore[misc]
     @auto_commit_after_request
     def set_up_grant_recipient_users(self, grant_id: UUID, collection_id: UUID) -> Any:
-        grant = get_grant(grant_id)
-        collection = get_collection(collection_id, grant_id=grant_id)
-        grant_recipients = get_grant_recipients(grant=grant)
-        form = PlatformAdminCreateGrantRecipientUserForm(grant_recipients=grant_recipients)
-
-        grant_recipient_users_by_org = get_grant_recipient_users_by_organisation(grant)
+        collection = get_collection(collection_id, grant_id=grant_id, with_grant=True)
+        grant = collection.grant
+        form = PlatformAdminCreateGrantRecipientUserForm()
 
         if form.validate_on_submit():
-            grant_recipient_names_to_ids = {gr.organisation.name: gr.organisation.id for gr in grant_recipients}
             users_data = form.get_normalised_users_data()
+            grant_recipient_names_to_ids = get_grant_recipient_organisation_ids_by_name(
+                grant, (org_name for org_name, _, _ in users_data)
+            )
 
-            # Validate all organisation names first before creating any users
-            invalid_orgs = []
-            for org_name, _, _ in users_data:
-                if org_name not in grant_recipient_names_to_ids:
-                    invalid_orgs.append(org_name)
+            # Validate all organisation names first before creating any users, collecting what we'd create as we go
+            invalid_orgs = set()
+            users_to_upsert = []
+            email_addresses_and_org_ids = []
+            for org_name, full_name, email_address in users_data:
+                org_id = grant_recipient_names_to_ids.get(org_name)
+                if org_id is None:
+                    invalid_orgs.add(org_name)
+                else:
+                    users_to_upsert.append((email_address, full_name))
+                    email_addresses_and_org_ids.append((email_address.lower(), org_id))
 
             if invalid_orgs:
-                unique_invalid_orgs = sorted(set(invalid_orgs))
-                for org_name in unique_invalid_orgs:
+                for org_name in sorted(invalid_orgs):
                     flash(f"Organisation '{org_name}' is not a grant recipient for this grant.", "error")
                 return self.render(
                     "deliver_grant_funding/admin/set-up-grant-recipient-users.html",
                     form=form,
                     grant=grant,
                     collection=collection,
-                    grant_recipient_users_by_org=grant_recipient_users_by_org,
+                    grant_recipient_users_by_org=get_grant_recipient_users_by_organisation(grant),
                 )
 
             # All organisations are valid, create all users
-            for org_name, full_name, email_address in users_data:
-                org_id = grant_recipient_names_to_ids[org_name]
-                user = upsert_user_by_email(email_address=email_address, name=full_name)
-                upsert_user_role(user=user, permissions=[RoleEnum.MEMBER], organisation_id=org_id, grant_id=grant.id)
+            users_by_email = upsert_users_by_email(users_to_upsert)
+            upsert_user_roles(
+                [(users_by_email[email_address], org_id) for email_address, org_id in email_addresses_and_org_ids],
+                permissions=[RoleEnum.MEMBER],
+                grant_id=grant.id,
+            )
 
             flash(
                 f"Successfully set up {len(users_data)} grant recipient {'user' if len(users_data) == 1 else 'users'}.",
@@ -242,28 +246,27 @@ class PlatformAdminReportingLifecycleView(PlatformAdminBaseView):
             form=form,
             grant=grant,
             collection=collection,
-            grant_recipient_users_by_org=grant_recipient_users_by_org,
+            # Only needed when rendering the page, so not loaded when we redirect after a successful submission.
+            grant_recipient_users_by_org=get_grant_recipient_users_by_organisation(grant),
         )
 
     @expose("/<uuid:grant_id>/<uuid:collection_id>/revoke-grant-recipient-users", methods=["GET", "POST"])  # type: ignore[misc]
     @auto_commit_after_request
     def revoke_grant_recipient_users(self, grant_id: UUID, collection_id: UUID) -> Any:
-        grant = get_grant(grant_id)
-        collection = get_collection(collection_id, grant_id=grant_id)
+        collection = get_collection(collection_id, grant_id=grant_id, with_grant=True)
+        grant = collection.grant
 
         user_roles = get_grant_recipient_user_roles(grant)
         form = PlatformAdminRevokeGrantRecipientUsersForm(user_roles=user_roles)
 
         if form.validate_on_submit():
-            revoked_count = 0
             assert form.user_roles.data
+            user_and_organisation_ids = []
             for user_role_id in form.user_roles.data:
                 user_id_str, org_id_str = user_role_id.split("|")
-                user_id = UUID(user_id_str)
-                org_id = UUID(org_id_str)
+                user_and_organisation_ids.append((UUID(user_id_str), UUID(org_id_str)))
 
-                if revoke_grant_recipient_user_role(user_id, org_id, grant.id):
-                    revoked_count += 1
+            revoked_count = revoke_grant_recipient_user_roles(user_and_organisation_ids, grant.id)
 
             if revoked_count > 0:
                 flash(
@@ -291,8 +294,10 @@ class PlatformAdminReportingLifecycleView(PlatformAdminBaseView):
     @expose("/<uuid:grant_id>/<uuid:collection_id>/set-dates", methods=["GET", "POST"])  # type: ignore[misc]
     @auto_commit_after_request
     def set_collection_dates(self, grant_id: UUID, collection_id: UUID) -> Any:
-        grant = get_grant(grant_id)
-        collection = get_collection(collection_id, grant_id=grant_id, type_=CollectionType.MONITORING_REPORT)
+        collection = get_collection(
+            collection_id, grant_id=grant_id, type_=CollectionType.MONITORING_REPORT, with_grant=True
+        )
+        grant = collection.grant
 
         if collection.status != CollectionStatusEnum.DRAFT:
             flash(
@@ -324,8 +329,10 @@ class PlatformAdminReportingLifecycleView(PlatformAdminBaseView):
     @expose("/<uuid:grant_id>/<uuid:collection_id>/schedule-report", methods=["GET", "POST"])  # type: ignore[misc]
     @auto_commit_after_request
     def schedule_report(self, grant_id: UUID, collection_id: UUID) -> Any:
-        grant = get_grant(grant_id)
-        collection = get_collection(collection_id, grant_id=grant_id, type_=CollectionType.MONITORING_REPORT)
+        collection = get_collection(
+            collection_id, grant_id=grant_id, type_=CollectionType.MONITORING_REPORT, with_grant=True
+        )
+        grant = collection.grant
 
         form = PlatformAdminScheduleReportForm()
         if form.validate_on_submit():
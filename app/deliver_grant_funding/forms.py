@@ -30,7 +30,7 @@ from app.common.expressions import ExpressionContext
 from app.common.expressions.registry import get_supported_form_questions
 from app.common.forms.fields import MHCLGAccessibleAutocomplete
 from app.common.forms.helpers import get_referenceable_questions
-from app.common.forms.validators import CommunitiesEmail, WordRange
+from app.common.forms.validators import INVALID_EMAIL_FORMAT_MESSAGE, CommunitiesEmail, WordRange
 
 if TYPE_CHECKING:
     from app.common.data.models import Component, Form, Group, Question
@@ -172,7 +172,7 @@ class GrantContactForm(GrantSetupForm):
         description="Use the shared email address for the grant team",
         validators=[
             DataRequired("Enter the email address"),
-            Email(message="Enter an email address in the correct format, like name@example.com"),
+            Email(message=INVALID_EMAIL_FORMAT_MESSAGE),
         ],
         filters=[strip_string_if_not_empty],
         widget=GovTextInput(),
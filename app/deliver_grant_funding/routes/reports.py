@@ -1940,11 +1940,8 @@ def export_report_submissions(
         case _:
             abort(400)
 
-    buffer = io.StringIO()
-    buffer.write(data)
-    buffer.seek(0)
     return send_file(
-        io.BytesIO(buffer.getvalue().encode("utf-8")),
+        io.BytesIO(data.encode("utf-8")),
         mimetype=mimetype,
         as_attachment=True,
         download_name=f"{report.name} - {submission_mode.name.lower()}.{export_format}",
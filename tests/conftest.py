@@ -1,3 +1,4 @@
+import importlib
 import typing as t
 from collections import namedtuple
 from typing import Any, Generator
@@ -134,6 +135,13 @@ def _precompile_templates(app: Flask) -> None:
         app.jinja_env.get_template(template_name)
 
 
+def _preimport_lazy_modules() -> None:
+    # Some slow-to-import dependencies are only imported by the app when first used, to keep worker start-up fast.
+    # Import them up front so that the cost doesn't land in whichever test happens to use them first and push it
+    # over our test time limits.
+    importlib.import_module("email_validator")
+
+
 _Factories = namedtuple(
     "_Factories",
     [
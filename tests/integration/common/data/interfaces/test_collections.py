@@ -30,6 +30,7 @@ from app.common.data.interfaces.collections import (
     delete_form,
     delete_question,
     get_collection,
+    get_collection_ids,
     get_expression,
     get_expression_by_id,
     get_form_by_id,
@@ -112,6 +113,27 @@ class TestGetCollection:
 
         # TODO: Extend with a test on another collection type when we extend the CollectionType enum.
 
+    def test_get_collection_with_grant(self, db_session, factories, track_sql_queries):
+        collection = factories.collection.create()
+        collection_id, grant_id = collection.id, collection.grant_id
+        db_session.expunge_all()
+
+        with track_sql_queries() as queries:
+            from_db = get_collection(collection_id=collection_id, grant_id=grant_id, with_grant=True)
+            assert from_db.grant.id == grant_id
+
+        assert len(queries) == 1
+
+
+class TestGetCollectionIds:
+    def test_get_collection_ids(self, db_session, factories):
+        grant = factories.grant.create()
+        collections = factories.collection.create_batch(3, grant=grant)
+        factories.collection.create()
+
+        assert set(get_collection_ids(grant.id, type_=CollectionType.MONITORING_REPORT)) == {c.id for c in collections}
+        assert len(get_collection_ids(grant.id, type_=CollectionType.MONITORING_REPORT, limit=2)) == 2
+
 
 class TestCreateCollection:
     def test_create_collection(self, db_session, factories):
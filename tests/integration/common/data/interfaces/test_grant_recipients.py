@@ -1,14 +1,18 @@
 from app.common.data.interfaces.grant_recipients import (
     all_grant_recipients_have_users,
     create_grant_recipients,
+    get_grant_recipient_organisation_ids_by_name,
     get_grant_recipient_user_roles,
     get_grant_recipient_users_by_organisation,
     get_grant_recipient_users_count,
     get_grant_recipients,
     get_grant_recipients_count,
+    get_reporting_lifecycle_counts,
     revoke_grant_recipient_user_role,
+    revoke_grant_recipient_user_roles,
 )
-from app.common.data.models import GrantRecipient
+from app.common.data.interfaces.organisations import get_organisation_count
+from app.common.data.models import Grant, GrantRecipient
 from app.common.data.types import RoleEnum
 
 
@@ -49,6 +53,22 @@ class TestGetGrantRecipients:
 
         assert result == []
 
+    def test_with_organisations(self, factories, db_session, track_sql_queries):
+        grant = factories.grant.create()
+        factories.grant_recipient.create_batch(3, grant=grant)
+        grant_id = grant.id
+        db_session.expunge_all()
+        grant = db_session.get(Grant, grant_id)
+
+        with track_sql_queries() as queries:
+            result = get_grant_recipients(grant, with_organisations=True)
+            assert len({gr.organisation.name for gr in result}) == 3
+
+        # Expected queries:
+        # * Load the grant recipients
+        # * Load their organisations
+        assert len(queries) == 2
+
 
 class TestGetGrantRecipientsCount:
     def test_returns_count_of_grant_recipients(self, factories, db_session):
@@ -88,6 +108,32 @@ class TestGetGrantRecipientsCount:
         assert result == 1
 
 
+class TestGetGrantRecipientOrganisationIdsByName:
+    def test_returns_ids_of_named_grant_recipients(self, factories, db_session):
+        grant = factories.grant.create()
+        other_grant = factories.grant.create()
+        org1 = factories.organisation.create(name="Organisation 1")
+        org2 = factories.organisation.create(name="Organisation 2")
+        org3 = factories.organisation.create(name="Organisation 3")
+        factories.organisation.create(name="Not a grant recipient")
+
+        factories.grant_recipient.create(grant=grant, organisation=org1)
+        factories.grant_recipient.create(grant=grant, organisation=org2)
+        factories.grant_recipient.create(grant=other_grant, organisation=org3)
+
+        result = get_grant_recipient_organisation_ids_by_name(
+            grant, ["Organisation 1", "Organisation 3", "Not a grant recipient", "Organisation 1"]
+        )
+
+        assert result == {"Organisation 1": org1.id}
+
+    def test_returns_empty_dict_when_no_names(self, factories, db_session):
+        grant = factories.grant.create()
+        factories.grant_recipient.create(grant=grant)
+
+        assert get_grant_recipient_organisation_ids_by_name(grant, []) == {}
+
+
 class TestCreateGrantRecipients:
     def test_creates_grant_recipients_for_organisations(self, factories, db_session):
         grant = factories.grant.create()
@@ -139,6 +185,17 @@ class TestCreateGrantRecipients:
         assert len(grant_recipients) == 3
         assert {gr.organisation_id for gr in grant_recipients} == {org1.id, org2.id, org3.id}
 
+    def test_creates_grant_recipients_in_a_single_query(self, factories, db_session, track_sql_queries):
+        grant = factories.grant.create()
+        grant_id = grant.id
+        organisation_ids = [org.id for org in factories.organisation.create_batch(5)]
+
+        with track_sql_queries() as queries:
+            create_grant_recipients(grant, organisation_ids)
+
+        assert len(queries) == 1
+        assert db_session.query(GrantRecipient).filter_by(grant_id=grant_id).count() == 5
+
 
 class TestGetGrantRecipientUsersCount:
     def test_no_grant_recipient_users(self, db_session, factories):
@@ -228,6 +285,36 @@ class TestGetGrantRecipientUsersCount:
         assert count == 0
 
 
+class TestGetReportingLifecycleCounts:
+    def test_returns_zero_counts_for_grant_without_recipients(self, db_session, factories):
+        grant = factories.grant.create()
+
+        counts = get_reporting_lifecycle_counts(grant)
+
+        assert counts.grant_recipients == 0
+        assert counts.grant_recipient_users == 0
+
+    def test_matches_individual_counts(self, db_session, factories):
+        grant = factories.grant.create()
+        other_grant = factories.grant.create()
+        factories.organisation.create(name="Not a grant recipient")
+        grant_recipients = factories.grant_recipient.create_batch(2, grant=grant)
+        factories.grant_recipient.create(grant=other_grant)
+        for user in factories.user.create_batch(3):
+            factories.user_role.create(
+                user=user, organisation=grant_recipients[0].organisation, grant=grant, permissions=[RoleEnum.MEMBER]
+            )
+        factories.user_role.create(
+            user=factories.user.create(), organisation=grant.organisation, grant=grant, permissions=[RoleEnum.MEMBER]
+        )
+
+        counts = get_reporting_lifecycle_counts(grant)
+
+        assert counts.organisations == get_organisation_count()
+        assert counts.grant_recipients == get_grant_recipients_count(grant) == 2
+        assert counts.grant_recipient_users == get_grant_recipient_users_count(grant) == 3
+
+
 class TestAllGrantRecipientsHaveUsers:
     def test_returns_false_when_no_grant_recipients(self, db_session, factories):
         grant = factories.grant.create()
@@ -649,3 +736,34 @@ class TestRevokeGrantRecipientUserRole:
         )
 
         assert revoke_grant_recipient_user_role(user_role.user_id, grant.organisation_id, grant.id) == 0
+
+
+class TestRevokeGrantRecipientUserRoles:
+    def test_revokes_only_the_given_user_roles(self, db_session, factories):
+        grant = factories.grant.create()
+        grant_recipient1, grant_recipient2 = factories.grant_recipient.create_batch(2, grant=grant)
+        user1, user2, user3 = factories.user.create_batch(3)
+        for user, grant_recipient in [(user1, grant_recipient1), (user2, grant_recipient2), (user3, grant_recipient1)]:
+            factories.user_role.create(
+                user=user, organisation=grant_recipient.organisation, grant=grant, permissions=[RoleEnum.MEMBER]
+            )
+
+        result = revoke_grant_recipient_user_roles(
+            [
+                (user1.id, grant_recipient1.organisation_id),
+                (user2.id, grant_recipient2.organisation_id),
+                (user3.id, grant_recipient2.organisation_id),
+            ],
+            grant.id,
+        )
+
+        assert result == 2
+        assert len(user1.roles) == 0
+        db_session.expire_all()
+        remaining_roles = get_grant_recipient_user_roles(grant)
+        assert [role.user_id for role in remaining_roles] == [user3.id]
+
+    def test_returns_zero_when_nothing_to_revoke(self, db_session, factories):
+        grant = factories.grant.create()
+
+        assert revoke_grant_recipient_user_roles([], grant.id) == 0
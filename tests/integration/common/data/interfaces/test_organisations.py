@@ -136,6 +136,30 @@ class TestUpsertOrganisations:
         assert org_from_db.name == "New Name"
         assert org_from_db.active_date == datetime.date(2021, 5, 15)
 
+    def test_repeated_external_id_uses_last_organisation_given(self, db_session):
+        orgs = [
+            OrganisationData(
+                external_id="GB-GOV-123",
+                name="First Name",
+                type=OrganisationType.CENTRAL_GOVERNMENT,
+                active_date=None,
+                retirement_date=None,
+            ),
+            OrganisationData(
+                external_id="GB-GOV-123",
+                name="Second Name",
+                type=OrganisationType.CENTRAL_GOVERNMENT,
+                active_date=None,
+                retirement_date=None,
+            ),
+        ]
+
+        upsert_organisations(orgs)
+
+        db_session.expire_all()
+        org_from_db = db_session.query(Organisation).filter_by(external_id="GB-GOV-123").one()
+        assert org_from_db.name == "Second Name"
+
     def test_sets_status_to_active_when_no_retirement_date(self, db_session):
         org = OrganisationData(
             external_id="GB-GOV-123",
@@ -173,6 +173,33 @@ class TestUpsertUserByEmail:
         assert db_session.scalar(select(func.count()).select_from(User)) == 1
 
 
+class TestUpsertUsersByEmail:
+    def test_creates_and_updates_users(self, db_session, factories):
+        existing_user = factories.user.create(email="existing@communities.gov.uk", name="Old Name")
+
+        users = interfaces.user.upsert_users_by_email(
+            [("new@communities.gov.uk", "New User"), ("existing@communities.gov.uk", "New Name")]
+        )
+
+        assert set(users) == {"new@communities.gov.uk", "existing@communities.gov.uk"}
+        assert users["new@communities.gov.uk"].name == "New User"
+        assert users["existing@communities.gov.uk"].id == existing_user.id
+        assert users["existing@communities.gov.uk"].name == "New Name"
+        assert db_session.scalar(select(func.count()).select_from(User)) == 2
+
+    def test_repeated_email_addresses_use_the_last_name_given(self, db_session):
+        users = interfaces.user.upsert_users_by_email(
+            [("test@communities.gov.uk", "First Name"), ("TEST@communities.gov.uk", "Second Name")]
+        )
+
+        assert list(users) == ["test@communities.gov.uk"]
+        assert users["test@communities.gov.uk"].name == "Second Name"
+        assert db_session.scalar(select(func.count()).select_from(User)) == 1
+
+    def test_no_users(self, db_session):
+        assert interfaces.user.upsert_users_by_email([]) == {}
+
+
 class TestUpsertUserByAzureAdSubjectId:
     def test_create_new_user(self, db_session):
         assert db_session.scalar(select(func.count()).select_from(User)) == 0
@@ -313,6 +340,31 @@ class TestUpsertUserRole:
         assert error.value.message == message
 
 
+class TestUpsertUserRoles:
+    def test_adds_and_updates_user_roles(self, db_session, factories):
+        grant = factories.grant.create()
+        organisation = factories.organisation.create(can_manage_grants=False)
+        user1, user2 = factories.user.create_batch(2)
+        interfaces.user.upsert_user_role(
+            user=user1, organisation_id=organisation.id, grant_id=grant.id, permissions=[RoleEnum.ADMIN]
+        )
+
+        interfaces.user.upsert_user_roles(
+            [(user1, organisation.id), (user2, organisation.id), (user2, organisation.id)],
+            permissions=[RoleEnum.MEMBER],
+            grant_id=grant.id,
+        )
+
+        assert {
+            (role.user_id, role.organisation_id, role.grant_id, tuple(role.permissions))
+            for role in db_session.scalars(select(UserRole))
+        } == {
+            (user1.id, organisation.id, grant.id, (RoleEnum.MEMBER,)),
+            (user2.id, organisation.id, grant.id, (RoleEnum.MEMBER,)),
+        }
+        assert len(user2.roles) == 1
+
+
 class TestSetUserRoleInterfaces:
     def test_set_platform_admin_role_for_user(self, db_session, factories) -> None:
         user = factories.user.create(email="test@communities.gov.uk")
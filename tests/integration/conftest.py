@@ -34,7 +34,7 @@ from app.common.data.models_user import User
 from app.common.data.types import AuthMethodEnum, RoleEnum
 from app.extensions.record_sqlalchemy_queries import QueryInfo, get_recorded_queries
 from app.services.notify import Notification
-from tests.conftest import FundingServiceTestClient, _Factories, _precompile_templates
+from tests.conftest import FundingServiceTestClient, _Factories, _precompile_templates, _preimport_lazy_modules
 from tests.integration.utils import TimeFreezer
 from tests.types import TemplateRenderRecord, TTemplatesRendered
 from tests.utils import build_db_config
@@ -108,6 +108,7 @@ def app(setup_db_container: PostgresContainer) -> Generator[Flask, None, None]:
 
     app.config.update({"TESTING": True})
     _precompile_templates(app)
+    _preimport_lazy_modules()
     yield app
 
 
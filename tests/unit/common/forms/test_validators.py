@@ -65,6 +65,14 @@ class TestWordRange:
 
         validator(form, field)  # Should not raise
 
+    @pytest.mark.parametrize("data", ["Two words", "Three words here", "Now four words here"])
+    def test_range_bounds_are_inclusive(self, data):
+        validator = WordRange(min_words=2, max_words=4)
+        form, field = self._get_mocks()
+        field.data = data
+
+        validator(form, field)  # Should not raise
+
     def test_invalid_outside_range(self):
         validator = WordRange(min_words=3, max_words=6)
         form, field = self._get_mocks()
@@ -73,6 +81,25 @@ class TestWordRange:
         with pytest.raises(ValidationError, match="Answer must be between 3 words and 6 words"):
             validator(form, field)
 
+    @pytest.mark.parametrize(
+        "data, valid",
+        [
+            ("  Three   words\n\there  ", True),
+            ("Four words\tin total", False),
+            (" ".join(["word"] * 100_000), False),
+        ],
+    )
+    def test_max_words_counts_any_whitespace(self, data, valid):
+        validator = WordRange(max_words=3)
+        form, field = self._get_mocks()
+        field.data = data
+
+        if valid:
+            validator(form, field)
+        else:
+            with pytest.raises(ValidationError, match="Answer must be 3 words or fewer"):
+                validator(form, field)
+
     def test_both_min_words_or_max_words_absent(self):
         with pytest.raises(ValueError):
             WordRange()
@@ -118,6 +145,16 @@ class TestCommunitiesEmailValidator:
         ):
             self._call_validator("bad-email-format")
 
+    @pytest.mark.parametrize("email", ["", None, "name.example.com"])
+    def test_email_without_at_sign_skips_full_validation(self, email):
+        with (
+            patch("email_validator.validate_email") as mock_validate_email,
+            pytest.raises(ValidationError, match="Enter an email address in the correct format, like name@example.com"),
+        ):
+            self._call_validator(email)
+
+        assert mock_validate_email.call_count == 0
+
     def test_case_insensitive_domain_match(self):
         self._call_validator("Staff@Communities.Gov.Uk")
 
@@ -151,6 +188,56 @@ class TestURLWithoutProtocol:
 
         assert validator(form, field)
 
+    @pytest.mark.parametrize(
+        "url, valid",
+        [
+            ("gov.uk/" + "a/" * 10_000, True),
+            ("gov.uk/" + "a?" * 10_000, True),
+            ("gov" + "-" * 20_000 + ":x", False),
+        ],
+    )
+    def test_long_urls_are_matched_in_linear_time(self, url, valid):
+        # The pattern only segments the URL left-to-right, so pathological inputs shouldn't cause runaway
+        # backtracking; the unit test time limit will catch any regression here.
+        form = Mock()
+        field = Mock()
+        field.data = url
+        field.gettext = lambda msg: msg
+        validator = URLWithoutProtocol()
+
+        if valid:
+            assert validator(form, field)
+        else:
+            with pytest.raises(ValidationError):
+                validator(form, field)
+
+    @pytest.mark.parametrize(
+        "url, valid",
+        [
+            ("127.0.0.1", True),
+            ("under_score.gov.uk", True),
+            ("bücher.de", True),
+            ("gov.abcdefghijklmnopqrstuvwxyz", False),
+            ("gov..uk", False),
+            ("-gov.uk", False),
+        ],
+    )
+    def test_hosts_not_matching_the_ascii_pattern_fall_back_to_hostname_validation(self, url, valid):
+        form = Mock()
+        field = Mock()
+        field.data = url
+        field.gettext = lambda msg: msg
+        validator = URLWithoutProtocol()
+
+        if valid:
+            assert validator(form, field)
+        else:
+            with pytest.raises(ValidationError):
+                validator(form, field)
+
+    def test_pattern_is_shared_between_instances(self):
+        assert URLWithoutProtocol().regex is URLWithoutProtocol(require_tld=False).regex
+
 
 class TestFinalOptionExclusive:
     def _get_mocks(self) -> tuple[FinalOptionExclusive, Mock, Mock]:
@@ -205,3 +292,10 @@ class TestFinalOptionExclusive:
         field.choices = options_list
 
         validator(form, field)
+
+    def test_choices_not_inspected_for_a_single_selection(self):
+        validator, form, field = self._get_mocks()
+        field.data = ["other"]
+        field.choices = None
+
+        validator(form, field)
@@ -81,6 +81,30 @@ class TestSubmissionHelper:
             group_questions = helper.cached_get_ordered_visible_questions(group)
             assert group_questions == [q1, q3]
 
+    class TestExpressionContexts:
+        def test_contexts_are_only_built_when_needed(self, factories, mocker):
+            submission = factories.submission.build()
+            mock_build = mocker.patch("app.common.helpers.collections.ExpressionContext.build_expression_context")
+
+            helper = SubmissionHelper(submission)
+            assert mock_build.call_count == 0
+
+            assert helper.cached_evaluation_context is helper.cached_evaluation_context
+            assert mock_build.call_count == 1
+
+    class TestFormData:
+        def test_answers_for_questions_not_in_the_collection_are_ignored(self, factories):
+            form = factories.form.build()
+            question = factories.question.build(form=form, data_type=QuestionDataType.INTEGER)
+            submission = factories.submission.build(
+                collection=form.collection,
+                data={str(question.id): {"value": 5}, str(uuid.uuid4()): {"value": "removed question"}},
+            )
+
+            helper = SubmissionHelper(submission)
+
+            assert helper.form_data() == {question.safe_qid: 5}
+
     class TestGetForm:
         def test_exists(self, db_session, factories):
             form = factories.form.build()
@@ -468,6 +492,7 @@ class TestSubmissionHelper:
                     submission=submission, form=form_one, key=SubmissionEventKey.FORM_RUNNER_FORM_COMPLETED
                 )
             ]
+            helper._clear_event_caches()
 
             # one complete form and one incomplete is still not completed
             assert helper.all_forms_are_completed is False
@@ -486,6 +511,7 @@ class TestSubmissionHelper:
                     submission=submission, form=form_two, key=SubmissionEventKey.FORM_RUNNER_FORM_COMPLETED
                 )
             )
+            helper._clear_event_caches()
 
             # all questions answered and all marked as complete is complete
             assert helper.all_forms_are_completed is True
@@ -525,11 +551,14 @@ class TestSubmissionHelper:
             assert helper.is_component_visible(group, helper.cached_evaluation_context) is False
 
             # when nested sub-components inherit the property of their parents
+            # (the form structure is fixed for the lifetime of a helper, so clear its cache when we move things around)
             question.parent = group
+            helper.cached_get_all_conditions_for_component.cache_clear()
             assert helper.is_component_visible(question, helper.cached_evaluation_context) is False
 
             # when further nested this still applies
             question.parent = sub_group
+            helper.cached_get_all_conditions_for_component.cache_clear()
             assert helper.is_component_visible(question, helper.cached_evaluation_context) is False
 
             # if the parents condition changes this is reflected
@@ -1,6 +1,9 @@
+import os
 from typing import get_type_hints
+from unittest.mock import patch
 
-from app.config import DevConfig, LocalConfig, ProdConfig, TestConfig, _SharedConfig
+from app.config import DevConfig, LocalConfig, ProdConfig, TestConfig, UnitTestConfig, _SharedConfig
+from tests.utils import build_db_config
 
 
 def test_config_subclasses_do_not_have_conflicting_types() -> None:
@@ -26,3 +29,12 @@ def test_config_subclasses_do_not_define_new_variables() -> None:
             assert attr_name in parent_class_types, (
                 f"SharedConfig does not define an {attr_name} config variable, but it is present on {subclass.__name__}"
             )
+
+
+def test_internal_domains_are_lowercased() -> None:
+    with patch.dict(
+        os.environ, {**build_db_config(None), "INTERNAL_DOMAINS": '["@Communities.GOV.uk", "@TEST.communities.gov.uk"]'}
+    ):
+        config = UnitTestConfig()  # type: ignore[call-arg]
+
+    assert config.INTERNAL_DOMAINS == ("@communities.gov.uk", "@test.communities.gov.uk")
@@ -8,7 +8,7 @@ from flask import Flask
 from flask_sqlalchemy_lite import SQLAlchemy
 
 from app import create_app
-from tests.conftest import _precompile_templates
+from tests.conftest import _precompile_templates, _preimport_lazy_modules
 from tests.utils import build_db_config
 
 
@@ -30,6 +30,7 @@ def app() -> Generator[Flask, None, None]:
 
     app.config.update({"TESTING": True})
     _precompile_templates(app)
+    _preimport_lazy_modules()
     yield app
 
 
@@ -0,0 +1,29 @@
+import datetime
+
+import pytest
+
+from app.deliver_grant_funding.admin.forms import _parse_tsv_date
+
+
+class TestParseTsvDate:
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("", None),
+            ("01/01/2020", datetime.date(2020, 1, 1)),
+            ("31/12/2023", datetime.date(2023, 12, 31)),
+            ("1/6/2021", datetime.date(2021, 6, 1)),
+        ],
+    )
+    def test_parses_dates(self, value, expected):
+        assert _parse_tsv_date(value) == expected
+
+    @pytest.mark.parametrize(
+        "value", ["2020-01-01", "01/01/20", "001/01/2020", "01/01/2020/01", "aa/01/2020", "31/02/2020"]
+    )
+    def test_rejects_invalid_dates(self, value):
+        with pytest.raises(ValueError):
+            datetime.datetime.strptime(value, "%d/%m/%Y")
+
+        with pytest.raises(ValueError):
+            _parse_tsv_date(value)